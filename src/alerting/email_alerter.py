@@ -56,7 +56,7 @@ class EmailAlerter(BaseAlerter):
         Returns:
             True if email was sent successfully.
         """
-        recipients = self.settings.get_smtp_recipients()
+        recipients = self.settings.smtp_recipients_list
         if not recipients:
             backup_logger.warning("No email recipients configured")
             return False
@@ -32,7 +32,7 @@ class AlertManager:
 
     def _init_alerters(self) -> None:
         """Initialize alerters based on configuration."""
-        channels = self.settings.get_alert_channels()
+        channels = self.settings.alert_channels_list
 
         if "email" in channels:
             missing = self._validate_email_config()
@@ -97,7 +97,7 @@ class AlertManager:
             Empty lists indicate valid configuration.
         """
         results = {}
-        channels = self.settings.get_alert_channels()
+        channels = self.settings.alert_channels_list
 
         if "email" in channels:
             results["email"] = self._validate_email_config()
@@ -5,13 +5,16 @@ Provides git operations for cloning repositories and creating bundles.
 Includes Git LFS support for complete backups.
 """
 
+import hashlib
 import os
 import shutil
 import subprocess
 import tarfile
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Callable, Optional
+from urllib.parse import urlsplit, urlunsplit
 
 from git import Repo, GitCommandError
 
@@ -28,6 +31,9 @@ class BackupResult:
     lfs_size: int = 0
     is_empty: bool = False
     has_lfs: bool = False
+    bundle_streamed: bool = False
+    bundle_reused: bool = False
+    refs_digest: Optional[str] = None
 
     @property
     def total_size(self) -> int:
@@ -35,21 +41,69 @@ class BackupResult:
         return self.bundle_size + self.lfs_size
 
 
+class BundleStream:
+    """Readable stdout of a `git bundle create -` process.
+
+    Counts the bytes read and checks the exit status of git at end of
+    stream, so a failed bundle raises instead of looking like a short one.
+    """
+
+    def __init__(self, process: subprocess.Popen, stderr: BinaryIO):
+        """Initialize the bundle stream.
+
+        Args:
+            process: Running git bundle process with stdout=PIPE.
+            stderr: File receiving the stderr of the process. A file instead
+                of a pipe, so git never blocks on a full stderr pipe while
+                the reader waits for stdout.
+        """
+        self.process = process
+        self.stderr = stderr
+        self.size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes from the bundle.
+
+        Raises:
+            subprocess.CalledProcessError: If git exited with an error.
+        """
+        data = self.process.stdout.read(size)
+        self.size += len(data)
+        if not data:
+            returncode = self.process.wait()
+            if returncode != 0:
+                self.stderr.seek(0)
+                stderr = self.stderr.read().decode(errors="replace")
+                raise subprocess.CalledProcessError(
+                    returncode, self.process.args, stderr=stderr
+                )
+        return data
+
+
 class GitBackup:
     """Handles git operations for backup."""
 
-    def __init__(self, work_dir: Path):
+    def __init__(self, work_dir: Path, mirror_cache_dir: Optional[Path] = None):
         """Initialize git backup handler.
 
         Args:
             work_dir: Working directory for backup operations.
+            mirror_cache_dir: Optional directory to keep mirror clones in
+                between runs. Cached mirrors are updated with a fetch instead
+                of being cloned again.
         """
         self.work_dir = work_dir
         self.work_dir.mkdir(parents=True, exist_ok=True)
+        self.mirror_cache_dir = mirror_cache_dir
+        if self.mirror_cache_dir is not None:
+            self.mirror_cache_dir.mkdir(parents=True, exist_ok=True)
 
     def mirror_clone(self, repo_url: str, repo_name: str) -> Path:
         """Clone a repository as a mirror.
 
+        With a mirror cache, an existing cached mirror is updated instead and
+        only re-cloned if the update fails.
+
         Args:
             repo_url: URL to clone from.
             repo_name: Name for the local clone.
@@ -60,7 +114,16 @@ class GitBackup:
         Raises:
             GitCommandError: If cloning fails.
         """
-        mirror_path = self.work_dir / f"{repo_name}.git"
+        if self.mirror_cache_dir is not None:
+            mirror_path = self.mirror_cache_dir / f"{repo_name}.git"
+            if mirror_path.exists():
+                try:
+                    self._update_mirror(mirror_path, repo_url)
+                    return mirror_path
+                except subprocess.CalledProcessError as e:
+                    backup_logger.debug(f"Updating cached mirror of {repo_name} failed, cloning again: {e.stderr}")
+        else:
+            mirror_path = self.work_dir / f"{repo_name}.git"
 
         # Remove existing directory if present
         if mirror_path.exists():
@@ -78,6 +141,75 @@ class GitBackup:
 
         return mirror_path
 
+    def _update_mirror(self, mirror_path: Path, repo_url: str) -> None:
+        """Fetch all changes into an existing mirror repository.
+
+        Args:
+            mirror_path: Path to the mirror repository.
+            repo_url: URL to fetch from.
+
+        Raises:
+            subprocess.CalledProcessError: If the fetch fails.
+        """
+        backup_logger.debug(f"Updating cached mirror {mirror_path.name}...")
+        env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+        for args in (
+            ["git", "remote", "set-url", "origin", repo_url],
+            ["git", "remote", "update", "--prune"],
+        ):
+            subprocess.run(
+                args,
+                cwd=str(mirror_path),
+                capture_output=True,
+                text=True,
+                check=True,
+                env=env,
+            )
+
+    def _release_mirror(self, mirror_path: Path, repo_url: str) -> None:
+        """Clean up a mirror repository after its backup files were created.
+
+        Cached mirrors are kept, with credentials removed from the stored
+        remote URL. Other mirrors are deleted to save space.
+
+        Args:
+            mirror_path: Path to the mirror repository.
+            repo_url: URL the mirror was cloned from.
+        """
+        if self.mirror_cache_dir is None:
+            shutil.rmtree(mirror_path, ignore_errors=True)
+            return
+
+        parts = urlsplit(repo_url)
+        public_url = urlunsplit(parts._replace(netloc=parts.netloc.rpartition("@")[2]))
+        subprocess.run(
+            ["git", "remote", "set-url", "origin", public_url],
+            cwd=str(mirror_path),
+            capture_output=True,
+        )
+
+    def get_refs_digest(self, mirror_path: Path) -> Optional[str]:
+        """Get a digest of all refs and the objects they point to.
+
+        Two mirrors with the same digest produce bundles with the same
+        content, even though the bundle files themselves are not
+        byte-for-byte reproducible.
+
+        Args:
+            mirror_path: Path to the mirror repository.
+
+        Returns:
+            SHA-256 hex digest of the ref list, or None if it cannot be read.
+        """
+        result = subprocess.run(
+            ["git", "show-ref", "--head"],
+            cwd=str(mirror_path),
+            capture_output=True,
+        )
+        if result.returncode != 0:
+            return None
+        return hashlib.sha256(result.stdout).hexdigest()
+
     def is_empty_repo(self, mirror_path: Path) -> bool:
         """Check if a repository is empty (has no commits).
 
@@ -111,7 +243,7 @@ class GitBackup:
         Raises:
             subprocess.CalledProcessError: If bundle creation fails (except for empty repos).
         """
-        bundle_path = mirror_path.with_suffix(".bundle")
+        bundle_path = self.work_dir / f"{mirror_path.stem}.bundle"
         repo_name = mirror_path.stem
 
         # Check if repository is empty
@@ -127,7 +259,7 @@ class GitBackup:
 
         try:
             result = subprocess.run(
-                ["git", "bundle", "create", str(bundle_path), "--all"],
+                ["git", "bundle", "create", str(bundle_path.absolute()), "--all"],
                 cwd=str(mirror_path),
                 capture_output=True,
                 text=True,
@@ -144,6 +276,46 @@ class GitBackup:
 
         return bundle_path
 
+    def stream_bundle(self, mirror_path: Path, sink: Callable[[BinaryIO], None]) -> int:
+        """Create a bundle of a mirror repository and stream it to a sink.
+
+        The bundle is never written to disk; the sink (e.g. an S3 upload)
+        reads it straight from git's stdout.
+
+        Args:
+            mirror_path: Path to the mirror repository.
+            sink: Callable consuming the bundle stream until EOF.
+
+        Returns:
+            Size of the bundle in bytes.
+
+        Raises:
+            subprocess.CalledProcessError: If bundle creation fails.
+        """
+        backup_logger.debug(f"Streaming bundle for {mirror_path.stem}...")
+
+        with tempfile.TemporaryFile() as stderr:
+            process = subprocess.Popen(
+                ["git", "bundle", "create", "-", "--all"],
+                cwd=str(mirror_path),
+                stdout=subprocess.PIPE,
+                stderr=stderr,
+                env={**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+            )
+            stream = BundleStream(process, stderr)
+            try:
+                sink(stream)
+                # Make sure the exit status is checked even if the sink stopped early
+                while stream.read(1024 * 1024):
+                    pass
+            finally:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+                process.stdout.close()
+
+        return stream.size
+
     def has_lfs(self, mirror_path: Path) -> bool:
         """Check if a repository uses Git LFS.
 
@@ -243,7 +415,7 @@ class GitBackup:
             backup_logger.debug(f"LFS objects directory is empty for {repo_name}")
             return None
 
-        archive_path = mirror_path.with_suffix(".lfs.tar.gz")
+        archive_path = self.work_dir / f"{mirror_path.stem}.lfs.tar.gz"
         backup_logger.debug(f"Creating LFS archive for {repo_name} ({len(lfs_files)} objects)...")
 
         try:
@@ -264,12 +436,23 @@ class GitBackup:
                 archive_path.unlink()
             return None
 
-    def clone_and_bundle(self, repo_url: str, repo_name: str) -> BackupResult:
+    def clone_and_bundle(
+        self,
+        repo_url: str,
+        repo_name: str,
+        bundle_sink: Optional[Callable[[BinaryIO], None]] = None,
+        reuse_bundle: Optional[Callable[[str], Optional[int]]] = None,
+    ) -> BackupResult:
         """Clone a repository and create backup files (bundle + LFS if applicable).
 
         Args:
             repo_url: URL to clone from.
             repo_name: Name for the repository.
+            bundle_sink: Optional callable the bundle is streamed to instead
+                of being written to the work directory.
+            reuse_bundle: Optional callable receiving the refs digest. Returns
+                the size of an existing bundle with the same refs that was
+                reused, or None if a new bundle has to be created.
 
         Returns:
             BackupResult with paths and sizes of backup files.
@@ -279,31 +462,43 @@ class GitBackup:
         # Clone repository
         mirror_path = self.mirror_clone(repo_url, repo_name)
 
-        # Check if empty
-        if self.is_empty_repo(mirror_path):
-            result.is_empty = True
-            shutil.rmtree(mirror_path)
-            return result
-
-        # Create git bundle
-        bundle_path = self.create_bundle(mirror_path)
-        if bundle_path:
-            result.bundle_path = bundle_path
-            result.bundle_size = bundle_path.stat().st_size
-
-        # Check for and handle LFS
-        if self.has_lfs(mirror_path):
-            result.has_lfs = True
-            backup_logger.debug(f"Repository {repo_name} uses Git LFS, fetching objects...")
-
-            if self.fetch_lfs_objects(mirror_path):
-                lfs_archive = self.create_lfs_archive(mirror_path)
-                if lfs_archive:
-                    result.lfs_path = lfs_archive
-                    result.lfs_size = lfs_archive.stat().st_size
-
-        # Cleanup mirror directory to save space
-        shutil.rmtree(mirror_path)
+        try:
+            # Check if empty
+            if self.is_empty_repo(mirror_path):
+                result.is_empty = True
+                return result
+
+            # Reuse the previous bundle if no ref has changed, otherwise create one
+            result.refs_digest = self.get_refs_digest(mirror_path)
+            reused_size = None
+            if reuse_bundle is not None and result.refs_digest is not None:
+                reused_size = reuse_bundle(result.refs_digest)
+
+            if reused_size is not None:
+                result.bundle_size = reused_size
+                result.bundle_reused = True
+            elif bundle_sink is not None:
+                result.bundle_size = self.stream_bundle(mirror_path, bundle_sink)
+                result.bundle_streamed = True
+            else:
+                bundle_path = self.create_bundle(mirror_path)
+                if bundle_path:
+                    result.bundle_path = bundle_path
+                    result.bundle_size = bundle_path.stat().st_size
+
+            # Check for and handle LFS
+            if self.has_lfs(mirror_path):
+                result.has_lfs = True
+                backup_logger.debug(f"Repository {repo_name} uses Git LFS, fetching objects...")
+
+                if self.fetch_lfs_objects(mirror_path):
+                    lfs_archive = self.create_lfs_archive(mirror_path)
+                    if lfs_archive:
+                        result.lfs_path = lfs_archive
+                        result.lfs_size = lfs_archive.stat().st_size
+        finally:
+            # Delete the mirror directory to save space (or keep it cached)
+            self._release_mirror(mirror_path, repo_url)
 
         return result
 
@@ -8,11 +8,13 @@ Supports two modes:
 - Unauthenticated: Without GITHUB_PAT - public repos only, 60 requests/hour
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Generator, Optional, Union
+from typing import Generator, Iterable, Optional, Union
 
 from github import Github, GithubException
+from github.PaginatedList import PaginatedList
 from github.Repository import Repository
 from github.Organization import Organization
 from github.AuthenticatedUser import AuthenticatedUser
@@ -24,10 +26,28 @@ from ui.console import backup_logger
 # Type alias for owner objects
 OwnerType = Union[Organization, AuthenticatedUser, NamedUser]
 
+# Number of repository list pages fetched concurrently
+REPO_PAGE_WORKERS = 8
+
+# GraphQL query for the number of issues, pull requests and releases of a repository
+METADATA_COUNTS_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    issues { totalCount }
+    pullRequests { totalCount }
+    releases { totalCount }
+  }
+}
+"""
+
 
-@dataclass
+@dataclass(slots=True)
 class RepoInfo:
-    """Repository information for backup processing."""
+    """Repository information for backup processing.
+
+    Snapshot of the listing fields, so the backup loop reads plain attributes
+    instead of PyGithub properties.
+    """
 
     repo: Repository
     name: str
@@ -35,6 +55,7 @@ class RepoInfo:
     pushed_at: str  # ISO format string for comparison
     has_wiki: bool
     private: bool
+    clone_url: str = ""  # HTTPS clone URL from the listing, without credentials
 
     @classmethod
     def from_repo(cls, repo: Repository) -> "RepoInfo":
@@ -51,6 +72,7 @@ class RepoInfo:
             pushed_at=pushed_at_dt.isoformat() if pushed_at_dt else "",
             has_wiki=repo.has_wiki,
             private=repo.private,
+            clone_url=repo.clone_url,
         )
 
 
@@ -71,12 +93,16 @@ class GitHubBackupClient:
         self.settings = settings
         self._authenticated = settings.is_authenticated
 
+        # One pooled connection per concurrent caller, so parallel repository
+        # backups keep their connections alive instead of reconnecting
+        pool_size = max(REPO_PAGE_WORKERS, settings.backup_parallelism)
+
         if self._authenticated:
             # Use per_page=100 for better performance with large orgs
-            self.gh = Github(settings.github_pat, per_page=100)
+            self.gh = Github(settings.github_pat, per_page=100, pool_size=pool_size)
             backup_logger.debug("GitHub client initialized with authentication (5000 req/hour)")
         else:
-            self.gh = Github(per_page=100)  # Unauthenticated
+            self.gh = Github(per_page=100, pool_size=pool_size)  # Unauthenticated
             backup_logger.debug(
                 "GitHub client initialized WITHOUT authentication. "
                 "Only public repositories accessible (60 req/hour rate limit). "
@@ -183,7 +209,8 @@ class GitHubBackupClient:
             repos = self.owner.get_repos()
             backup_logger.debug("Fetching public repos from user (NamedUser)")
 
-        # Log expected count from API (PyGithub handles pagination automatically)
+        # Log expected count from API
+        expected_count = None
         try:
             expected_count = repos.totalCount
             backup_logger.debug(f"GitHub API reports {expected_count} repositories")
@@ -197,14 +224,12 @@ class GitHubBackupClient:
         skipped_archived = 0
         skipped_other = 0
 
-        # PyGithub PaginatedList handles pagination automatically (30-100 repos per page)
-        # We iterate through all pages transparently
-        for repo in repos:
+        for repo in self._iter_pages(repos, expected_count):
             total_count += 1
 
             # Progress logging every 100 repos for large orgs
             if total_count % 100 == 0:
-                backup_logger.debug(f"Scanning repositories... {total_count} processed")
+                backup_logger.debug("Scanning repositories... %d processed", total_count)
 
             if self._should_backup(repo):
                 yielded_count += 1
@@ -229,6 +254,51 @@ class GitHubBackupClient:
             + (f", {skipped_other} other" if skipped_other else "")
         )
 
+    def _iter_pages(
+        self, repos: PaginatedList, expected_count: Optional[int]
+    ) -> Iterable[Repository]:
+        """Iterate a paginated repository list, fetching pages concurrently.
+
+        Once the total count is known, all pages are requested in parallel
+        and yielded in order. Repositories that move between pages while
+        listing are only yielded once, and pages beyond the expected count
+        are fetched if repositories were added meanwhile. Without a total
+        count, PyGithub's sequential pagination is used.
+
+        Args:
+            repos: Paginated list of repositories.
+            expected_count: Total number of repositories, if known.
+
+        Yields:
+            Repository objects.
+        """
+        if not expected_count:
+            yield from repos
+            return
+
+        per_page = self.gh.per_page
+        page_count = -(-expected_count // per_page)
+        seen: set[int] = set()
+
+        def pages() -> Iterable[list[Repository]]:
+            with ThreadPoolExecutor(max_workers=min(REPO_PAGE_WORKERS, page_count)) as executor:
+                page = []
+                for page in executor.map(repos.get_page, range(page_count)):
+                    yield page
+
+            # A full last page means more repositories may have been added
+            page_index = page_count
+            while len(page) == per_page:
+                page = repos.get_page(page_index)
+                page_index += 1
+                yield page
+
+        for page in pages():
+            for repo in page:
+                if repo.id not in seen:
+                    seen.add(repo.id)
+                    yield repo
+
     def _should_backup(self, repo: Repository) -> bool:
         """Determine if a repository should be included in the backup.
 
@@ -240,17 +310,17 @@ class GitHubBackupClient:
         """
         # Skip private repos if not configured
         if repo.private and not self.settings.github_backup_private:
-            backup_logger.debug(f"Skipping private repo: {repo.full_name}")
+            backup_logger.debug("Skipping private repo: %s", repo.full_name)
             return False
 
         # Skip forks if not configured
         if repo.fork and not self.settings.github_backup_forks:
-            backup_logger.debug(f"Skipping fork: {repo.full_name}")
+            backup_logger.debug("Skipping fork: %s", repo.full_name)
             return False
 
         # Skip archived if not configured
         if repo.archived and not self.settings.github_backup_archived:
-            backup_logger.debug(f"Skipping archived repo: {repo.full_name}")
+            backup_logger.debug("Skipping archived repo: %s", repo.full_name)
             return False
 
         return True
@@ -270,7 +340,7 @@ class GitHubBackupClient:
         Returns:
             Clone URL (with embedded PAT when authenticated).
         """
-        clone_url = repo_info.repo.clone_url
+        clone_url = repo_info.clone_url or repo_info.repo.clone_url
 
         # Always embed token when authenticated - needed for private repos,
         # internal org repos, and doesn't hurt for public repos
@@ -294,7 +364,7 @@ class GitHubBackupClient:
             return None
 
         # Use removesuffix to only replace the trailing .git, not .git in repo names like .github
-        clone_url = repo_info.repo.clone_url
+        clone_url = repo_info.clone_url or repo_info.repo.clone_url
         if clone_url.endswith(".git"):
             wiki_url = clone_url[:-4] + ".wiki.git"
         else:
@@ -309,6 +379,38 @@ class GitHubBackupClient:
             )
         return wiki_url
 
+    def get_metadata_counts(self, repo_info: RepoInfo) -> Optional[dict[str, int]]:
+        """Get the number of issues, pull requests and releases of a repository.
+
+        Uses a single GraphQL request, so exporters for empty metadata types
+        can be skipped without paginating the REST API. GraphQL requires
+        authentication.
+
+        Args:
+            repo_info: Repository information.
+
+        Returns:
+            Dict with 'issues', 'prs' and 'releases' counts, or None if the
+            counts could not be determined.
+        """
+        if not self._authenticated:
+            return None
+
+        owner, _, name = repo_info.full_name.partition("/")
+        try:
+            _, data = self.gh.requester.graphql_query(
+                METADATA_COUNTS_QUERY, {"owner": owner, "name": name}
+            )
+            repository = data["data"]["repository"]
+            return {
+                "issues": repository["issues"]["totalCount"],
+                "prs": repository["pullRequests"]["totalCount"],
+                "releases": repository["releases"]["totalCount"],
+            }
+        except (GithubException, KeyError, TypeError) as e:
+            backup_logger.debug(f"Could not get metadata counts for {repo_info.full_name}: {e}")
+            return None
+
     def count_repositories(self) -> int:
         """Count the total number of repositories to backup.
 
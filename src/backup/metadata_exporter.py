@@ -4,12 +4,12 @@ GitHub Backup - Metadata Exporter Module
 Exports repository metadata (issues, pull requests, releases) to JSON.
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
 from github import GithubException
+from pydantic_core import to_json
 from github.Repository import Repository
 
 from ui.console import backup_logger
@@ -27,11 +27,23 @@ class MetadataExporter:
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    def export_all(self, repo: Repository) -> dict[str, int]:
+    def export_all(
+        self,
+        repo: Repository,
+        skip_issues: bool = False,
+        skip_prs: bool = False,
+        skip_releases: bool = False,
+    ) -> dict[str, int]:
         """Export all metadata for a repository.
 
+        Skipped metadata types are written as empty lists without querying
+        the GitHub API, so the exported files are the same for every repo.
+
         Args:
             repo: The repository to export metadata from.
+            skip_issues: Repository is known to have no issues.
+            skip_prs: Repository is known to have no pull requests.
+            skip_releases: Repository is known to have no releases.
 
         Returns:
             Dictionary with counts of exported items.
@@ -47,22 +59,31 @@ class MetadataExporter:
 
         # Export issues
         try:
-            issues = self.export_issues(repo, repo_dir / "issues.json")
-            counts["issues"] = len(issues)
+            if skip_issues:
+                self._write_json([], repo_dir / "issues.json")
+            else:
+                issues = self.export_issues(repo, repo_dir / "issues.json")
+                counts["issues"] = len(issues)
         except GithubException as e:
             backup_logger.warning(f"Failed to export issues for {repo.name}: {e}")
 
         # Export pull requests
         try:
-            prs = self.export_pull_requests(repo, repo_dir / "pull-requests.json")
-            counts["prs"] = len(prs)
+            if skip_prs:
+                self._write_json([], repo_dir / "pull-requests.json")
+            else:
+                prs = self.export_pull_requests(repo, repo_dir / "pull-requests.json")
+                counts["prs"] = len(prs)
         except GithubException as e:
             backup_logger.warning(f"Failed to export PRs for {repo.name}: {e}")
 
         # Export releases
         try:
-            releases = self.export_releases(repo, repo_dir / "releases.json")
-            counts["releases"] = len(releases)
+            if skip_releases:
+                self._write_json([], repo_dir / "releases.json")
+            else:
+                releases = self.export_releases(repo, repo_dir / "releases.json")
+                counts["releases"] = len(releases)
         except GithubException as e:
             backup_logger.warning(f"Failed to export releases for {repo.name}: {e}")
 
@@ -218,6 +239,10 @@ class MetadataExporter:
 
     @staticmethod
     def _write_json(data: Any, path: Path) -> None:
-        """Write data to a JSON file."""
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        """Write data to a JSON file.
+
+        Uses pydantic-core's native serializer, which produces the same
+        output as json.dump(indent=2, ensure_ascii=False) several times faster.
+        """
+        with open(path, "wb") as f:
+            f.write(to_json(data, indent=2))
@@ -4,20 +4,29 @@ GitHub Backup - CLI Module
 Command-line interface for backup management and restore operations.
 """
 
+import gzip
+import io
+import os
 import shutil
 import subprocess
 import tarfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
 import typer
+from botocore.exceptions import ClientError
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Confirm
 
-from config import Settings
-from storage.s3_client import S3Storage
+from config import Settings, get_settings
+from storage.s3_client import S3Storage, is_not_found
 from ui.console import format_size
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -32,6 +41,9 @@ app = typer.Typer(
 
 console = Console()
 
+# Number of stderr lines kept from long-running git commands
+STDERR_TAIL_LINES = 200
+
 
 # ───────────────────────────────────────────────────────────────────────────────
 # List Command
@@ -39,12 +51,14 @@ console = Console()
 @app.command("list")
 def list_backups():
     """List all available backups."""
-    settings = Settings()
+    settings = get_settings()
     s3 = S3Storage(settings)
 
-    backups = s3.list_backups()
+    # One listing provides backup IDs, sizes and repo counts
+    with console.status("Collecting backup details..."):
+        summaries = s3.get_backup_summaries()
 
-    if not backups:
+    if not summaries:
         console.print("[yellow]No backups found.[/]")
         return
 
@@ -54,9 +68,9 @@ def list_backups():
     table.add_column("Size", justify="right", style="green")
     table.add_column("Repositories", justify="right")
 
-    for idx, backup_id in enumerate(backups, 1):
-        size = s3.get_backup_size(backup_id)
-        repos = _count_repos_in_backup(s3, backup_id)
+    # Sort by date (newest first)
+    for idx, backup_id in enumerate(sorted(summaries, reverse=True), 1):
+        size, repos = summaries[backup_id]
         table.add_row(str(idx), backup_id, format_size(size), str(repos))
 
     console.print(table)
@@ -68,7 +82,7 @@ def list_backups():
 @app.command("show")
 def show_backup(backup_id: str = typer.Argument(..., help="Backup ID to show details for")):
     """Show details of a specific backup."""
-    settings = Settings()
+    settings = get_settings()
     s3 = S3Storage(settings)
 
     repos = _list_repos_in_backup(s3, backup_id)
@@ -103,18 +117,19 @@ def delete_backup(
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation"),
 ):
     """Delete a backup from S3 storage."""
-    settings = Settings()
+    settings = get_settings()
     s3 = S3Storage(settings)
 
-    # Check if backup exists
-    backups = s3.list_backups()
+    # Check if backup exists (repositories are listed once for all steps)
+    repos = s3.list_repos()
+    backups = s3.list_backups(repos)
     if backup_id not in backups:
         console.print(f"[red]Backup '{backup_id}' not found.[/]")
         raise typer.Exit(1)
 
     # Confirm deletion
     if not force:
-        size = s3.get_backup_size(backup_id)
+        size = s3.get_backup_size(backup_id, repos)
         console.print(f"\nBackup: [cyan]{backup_id}[/]")
         console.print(f"Size: [green]{format_size(size)}[/]")
         if not Confirm.ask("\n[yellow]Delete this backup?[/]"):
@@ -122,7 +137,7 @@ def delete_backup(
             return
 
     # Delete
-    deleted = s3.delete_backup(backup_id)
+    deleted = s3.delete_backup(backup_id, repos)
     console.print(f"[green]✓ Deleted backup '{backup_id}' ({deleted} objects)[/]")
 
 
@@ -141,7 +156,7 @@ def restore_local(
     include_wiki: bool = typer.Option(False, "--wiki", "-w", help="Also restore wiki"),
 ):
     """Restore a repository to a local directory (includes LFS objects if present)."""
-    settings = Settings()
+    settings = get_settings()
     s3 = S3Storage(settings)
 
     output_path = output_path.resolve()
@@ -149,10 +164,13 @@ def restore_local(
     # Download and restore
     console.print(Panel(f"Restoring [cyan]{repo_name}[/] to [green]{output_path}[/]"))
 
-    with console.status("Downloading bundle..."):
-        bundle_path = _download_bundle(s3, backup_id, repo_name, settings)
+    with console.status("Downloading bundle, LFS objects" + (" and wiki..." if include_wiki else "...")):
+        bundle_path, lfs_archive, wiki_bundle = _download_artifacts(
+            s3, backup_id, repo_name, settings, include_wiki=include_wiki
+        )
 
     if not bundle_path:
+        _remove_files(lfs_archive, wiki_bundle)
         console.print(f"[red]Bundle for '{repo_name}' not found in backup.[/]")
         raise typer.Exit(1)
 
@@ -165,10 +183,7 @@ def restore_local(
 
     console.print(f"[green]✓ Repository restored to {output_path}[/]")
 
-    # Check for LFS archive and restore if present
-    with console.status("Checking for LFS objects..."):
-        lfs_archive = _download_lfs_archive(s3, backup_id, repo_name, settings)
-
+    # Restore LFS objects if present
     if lfs_archive:
         console.print("Restoring LFS objects...")
         if _restore_lfs_objects(lfs_archive, output_path):
@@ -178,7 +193,6 @@ def restore_local(
     # Restore wiki if requested
     if include_wiki:
         wiki_path = output_path.parent / f"{repo_name}.wiki"
-        wiki_bundle = _download_wiki_bundle(s3, backup_id, repo_name, settings)
         if wiki_bundle:
             _clone_from_bundle(wiki_bundle, wiki_path)
             wiki_bundle.unlink()
@@ -187,6 +201,61 @@ def restore_local(
             console.print("[yellow]Wiki not found in backup.[/]")
 
 
+@restore_app.command("local-all")
+def restore_local_all(
+    backup_id: str = typer.Argument(..., help="Backup ID"),
+    output_path: Path = typer.Argument(..., help="Output directory (one subdirectory per repository)"),
+    workers: int = typer.Option(
+        min(os.cpu_count() or 1, 8), "--workers", "-j",
+        help="Number of repositories restored in parallel"
+    ),
+):
+    """Restore all repositories of a backup to a local directory in parallel."""
+    settings = get_settings()
+    s3 = S3Storage(settings)
+
+    output_path = output_path.resolve()
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    repos = [repo for repo in _list_repos_in_backup(s3, backup_id) if repo.get("has_bundle")]
+
+    if not repos:
+        console.print(f"[red]Backup '{backup_id}' not found or contains no bundles.[/]")
+        raise typer.Exit(1)
+
+    console.print(Panel(
+        f"Restoring [cyan]{len(repos)}[/] repositories to [green]{output_path}[/] "
+        f"using {workers} worker(s)"
+    ))
+
+    failed = 0
+    with ProcessPoolExecutor(max_workers=max(workers, 1)) as executor:
+        futures = {
+            executor.submit(
+                _restore_local_worker, backup_id, repo["name"], output_path / repo["name"], repo["has_lfs"]
+            ): repo["name"]
+            for repo in repos
+        }
+        for future in as_completed(futures):
+            repo_name = futures[future]
+            try:
+                error = future.result()
+            except Exception as e:
+                error = str(e)
+
+            if error:
+                failed += 1
+                console.print(f"  [red]✗[/] {repo_name}: [red]{error}[/]")
+            else:
+                console.print(f"  [green]✓[/] {repo_name}")
+
+    if failed:
+        console.print(f"[red]✗ {failed} of {len(repos)} repositories failed to restore[/]")
+        raise typer.Exit(1)
+
+    console.print(f"[green]✓ {len(repos)} repositories restored to {output_path}[/]")
+
+
 @restore_app.command("github")
 def restore_github(
     backup_id: str = typer.Argument(..., help="Backup ID"),
@@ -199,7 +268,7 @@ def restore_github(
     force: bool = typer.Option(False, "--force", "-f", help="Force push (overwrites remote)"),
 ):
     """Restore a repository to GitHub (includes LFS objects if present)."""
-    settings = Settings()
+    settings = get_settings()
     s3 = S3Storage(settings)
 
     if target_repo is None:
@@ -214,65 +283,39 @@ def restore_github(
         console.print("[dim]Cancelled.[/]")
         return
 
-    # Download bundle
-    with console.status("Downloading bundle..."):
-        bundle_path = _download_bundle(s3, backup_id, repo_name, settings)
-
-    if not bundle_path:
-        console.print(f"[red]Bundle for '{repo_name}' not found.[/]")
-        raise typer.Exit(1)
-
-    # Check for LFS archive
-    with console.status("Checking for LFS objects..."):
-        lfs_archive = _download_lfs_archive(s3, backup_id, repo_name, settings)
-
-    # Create temp directory for clone
+    # Temp directory for the bare clone: the repository is only pushed,
+    # so no working tree is needed
     temp_dir = Path(settings.data_dir) / "restore_temp" / repo_name
     temp_dir.parent.mkdir(parents=True, exist_ok=True)
 
-    try:
-        # Clone from bundle
-        _clone_from_bundle(bundle_path, temp_dir)
-
-        # Restore LFS objects if present (before pushing)
-        if lfs_archive:
-            console.print("Restoring LFS objects...")
-            _restore_lfs_objects(lfs_archive, temp_dir)
-
-        # Set remote
-        remote_url = f"https://{settings.github_pat}@github.com/{target_repo}.git"
-        subprocess.run(
-            ["git", "remote", "set-url", "origin", remote_url],
-            cwd=temp_dir, check=True, capture_output=True
-        )
-
-        # Push
-        push_args = ["git", "push", "--mirror" if force else "--all", "origin"]
-        result = subprocess.run(push_args, cwd=temp_dir, capture_output=True, text=True)
-
-        if result.returncode != 0:
-            console.print(f"[red]Push failed: {result.stderr}[/]")
-            raise typer.Exit(1)
-
-        console.print(f"[green]✓ Repository restored to {target_repo}[/]")
-
-        # Push LFS objects if present
-        if lfs_archive:
-            console.print("Pushing LFS objects...")
-            if _push_lfs_objects(temp_dir):
-                console.print("[green]✓ LFS objects pushed[/]")
+    remote_url = f"https://{settings.github_pat}@github.com/{target_repo}.git"
 
+    try:
+        with console.status("Restoring (downloading, cloning and pushing)..."):
+            result, lfs_result, wiki_bundle = _restore_to_remote(
+                s3, backup_id, repo_name, settings, remote_url, force, temp_dir, include_wiki=include_wiki
+            )
     finally:
-        # Cleanup
-        bundle_path.unlink(missing_ok=True)
-        if lfs_archive:
-            lfs_archive.unlink(missing_ok=True)
         if temp_dir.exists():
             shutil.rmtree(temp_dir)
 
-    # Restore wiki
+    if result is None:
+        console.print(f"[red]Bundle for '{repo_name}' not found.[/]")
+        raise typer.Exit(1)
+
+    if result.returncode != 0:
+        # Wiki is not restored if the main repository failed
+        _remove_files(wiki_bundle)
+        console.print(f"[red]Push failed: {result.stderr}[/]")
+        raise typer.Exit(1)
+
+    console.print(f"[green]✓ Repository restored to {target_repo}[/]")
+    if lfs_result:
+        _print_lfs_push_result(lfs_result)
+
+    # Restore wiki (bundle was downloaded together with the main bundle)
     if include_wiki:
-        _restore_wiki_to_github(s3, backup_id, repo_name, target_repo, settings, force)
+        _restore_wiki_to_github(wiki_bundle, repo_name, target_repo, settings, force)
 
 
 @restore_app.command("git")
@@ -283,7 +326,7 @@ def restore_git(
     force: bool = typer.Option(False, "--force", "-f", help="Force push (overwrites remote)"),
 ):
     """Restore a repository to any Git remote (includes LFS objects if present)."""
-    settings = Settings()
+    settings = get_settings()
     s3 = S3Storage(settings)
 
     console.print(Panel(
@@ -295,56 +338,30 @@ def restore_git(
         console.print("[dim]Cancelled.[/]")
         return
 
-    # Download bundle
-    with console.status("Downloading bundle..."):
-        bundle_path = _download_bundle(s3, backup_id, repo_name, settings)
-
-    if not bundle_path:
-        console.print(f"[red]Bundle for '{repo_name}' not found.[/]")
-        raise typer.Exit(1)
-
-    # Check for LFS archive
-    with console.status("Checking for LFS objects..."):
-        lfs_archive = _download_lfs_archive(s3, backup_id, repo_name, settings)
-
     temp_dir = Path(settings.data_dir) / "restore_temp" / repo_name
     temp_dir.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        _clone_from_bundle(bundle_path, temp_dir)
-
-        # Restore LFS objects if present (before pushing)
-        if lfs_archive:
-            console.print("Restoring LFS objects...")
-            _restore_lfs_objects(lfs_archive, temp_dir)
-
-        subprocess.run(
-            ["git", "remote", "set-url", "origin", remote_url],
-            cwd=temp_dir, check=True, capture_output=True
-        )
-
-        push_args = ["git", "push", "--mirror" if force else "--all", "origin"]
-        result = subprocess.run(push_args, cwd=temp_dir, capture_output=True, text=True)
-
-        if result.returncode != 0:
-            console.print(f"[red]Push failed: {result.stderr}[/]")
-            raise typer.Exit(1)
-
-        console.print(f"[green]✓ Repository pushed to {remote_url}[/]")
-
-        # Push LFS objects if present
-        if lfs_archive:
-            console.print("Pushing LFS objects...")
-            if _push_lfs_objects(temp_dir):
-                console.print("[green]✓ LFS objects pushed[/]")
-
+        with console.status("Restoring (downloading, cloning and pushing)..."):
+            result, lfs_result, _ = _restore_to_remote(
+                s3, backup_id, repo_name, settings, remote_url, force, temp_dir
+            )
     finally:
-        bundle_path.unlink(missing_ok=True)
-        if lfs_archive:
-            lfs_archive.unlink(missing_ok=True)
         if temp_dir.exists():
             shutil.rmtree(temp_dir)
 
+    if result is None:
+        console.print(f"[red]Bundle for '{repo_name}' not found.[/]")
+        raise typer.Exit(1)
+
+    if result.returncode != 0:
+        console.print(f"[red]Push failed: {result.stderr}[/]")
+        raise typer.Exit(1)
+
+    console.print(f"[green]✓ Repository pushed to {remote_url}[/]")
+    if lfs_result:
+        _print_lfs_push_result(lfs_result)
+
 
 # ───────────────────────────────────────────────────────────────────────────────
 # Download Command
@@ -354,9 +371,17 @@ def download_backup(
     backup_id: str = typer.Argument(..., help="Backup ID"),
     output_path: Path = typer.Argument(..., help="Output directory"),
     repo_name: Optional[str] = typer.Option(None, "--repo", "-r", help="Specific repo only"),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", "-j",
+        help="Number of parallel downloads (default: S3_MAX_POOL_CONNECTIONS)"
+    ),
+    native: bool = typer.Option(
+        True, "--native/--no-native",
+        help="Use s5cmd or the AWS CLI when installed instead of the built-in downloader (with --repo)"
+    ),
 ):
     """Download backup files from S3 to local directory."""
-    settings = Settings()
+    settings = get_settings()
     s3 = S3Storage(settings)
 
     output_path = output_path.resolve()
@@ -364,27 +389,41 @@ def download_backup(
 
     console.print(f"Downloading backup [cyan]{backup_id}[/] to [green]{output_path}[/]")
 
-    prefix = f"{s3.prefix}/{backup_id}/"
-    if repo_name:
-        prefix += f"{repo_name}/"
+    # Keep as many requests in flight as the S3 connection pool allows
+    workers = max(1, min(workers or settings.s3_max_pool_connections, settings.s3_max_pool_connections))
+
+    # Prefer a native S3 client (parallel Go/CRT transfers) when one is installed.
+    # A single repository is one key prefix; a whole backup is spread over
+    # all repository prefixes and needs the filtered listing below.
+    if native and repo_name:
+        prefix = f"{s3.prefix}/{repo_name}/{backup_id}/"
+        if _download_with_native_tool(settings, s3.bucket, prefix, output_path / repo_name, workers):
+            return
 
     # List and download all objects
-    paginator = s3.s3.get_paginator("list_objects_v2")
+    with console.status("Listing objects..."):
+        objects = s3.list_backup_objects(backup_id, repo_name)
+
     total_files = 0
     total_size = 0
 
-    with console.status("Downloading...") as status:
-        for page in paginator.paginate(Bucket=s3.bucket, Prefix=prefix):
-            for obj in page.get("Contents", []):
-                key = obj["Key"]
-                rel_path = key.replace(f"{s3.prefix}/{backup_id}/", "")
-                local_path = output_path / rel_path
+    def download_object(obj: dict) -> int:
+        # Key structure: {prefix}/{repo}/{backup_id}/{file} -> {output}/{repo}/{file}
+        key = obj["Key"]
+        repo, _, rest = key[len(s3.prefix) + 1:].partition("/")
+        local_path = output_path / repo / rest.partition("/")[2]
 
-                local_path.parent.mkdir(parents=True, exist_ok=True)
-                s3.s3.download_file(s3.bucket, key, str(local_path))
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        s3.s3.download_file(s3.bucket, key, str(local_path), Config=s3.transfer_config)
+        return obj.get("Size", 0)
 
+    # Download objects concurrently; progress is reported from the main thread
+    with console.status("Downloading...") as status:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(download_object, obj) for obj in objects]
+            for future in as_completed(futures):
                 total_files += 1
-                total_size += obj.get("Size", 0)
+                total_size += future.result()
                 status.update(f"Downloaded {total_files} files ({format_size(total_size)})")
 
     console.print(f"[green]✓ Downloaded {total_files} files ({format_size(total_size)})[/]")
@@ -393,107 +432,384 @@ def download_backup(
 # ───────────────────────────────────────────────────────────────────────────────
 # Helper Functions
 # ───────────────────────────────────────────────────────────────────────────────
-def _count_repos_in_backup(s3: S3Storage, backup_id: str) -> int:
-    """Count repositories in a backup."""
-    prefix = f"{s3.prefix}/{backup_id}/"
-    response = s3.s3.list_objects_v2(
-        Bucket=s3.bucket, Prefix=prefix, Delimiter="/"
-    )
-    return len(response.get("CommonPrefixes", []))
+def _download_with_native_tool(
+    settings: Settings,
+    bucket: str,
+    prefix: str,
+    dest: Path,
+    workers: int,
+) -> bool:
+    """Download all objects below a prefix with s5cmd or the AWS CLI.
+
+    Args:
+        settings: Application settings (endpoint and credentials).
+        bucket: S3 bucket name.
+        prefix: Key prefix to download (ending with "/").
+        dest: Local directory that receives the objects below prefix.
+        workers: Number of parallel transfers.
+
+    Returns:
+        True if a native tool downloaded the files, False if none is
+        installed or it failed (the caller falls back to boto3).
+    """
+    endpoint_args = ["--endpoint-url", settings.s3_endpoint_url] if settings.s3_endpoint_url else []
+
+    if shutil.which("s5cmd"):
+        tool = "s5cmd"
+        args = [
+            "s5cmd", *endpoint_args, "--numworkers", str(workers),
+            "cp", f"s3://{bucket}/{prefix}*", f"{dest}/",
+        ]
+    elif shutil.which("aws"):
+        tool = "aws s3 sync"
+        args = ["aws", *endpoint_args, "s3", "sync", "--only-show-errors", f"s3://{bucket}/{prefix}", str(dest)]
+    else:
+        return False
+
+    env = {
+        **os.environ,
+        "AWS_ACCESS_KEY_ID": settings.s3_access_key,
+        "AWS_SECRET_ACCESS_KEY": settings.s3_secret_key,
+        "AWS_REGION": settings.s3_region,
+        "AWS_DEFAULT_REGION": settings.s3_region,
+    }
+
+    dest.mkdir(parents=True, exist_ok=True)
+
+    # Poll the destination for progress while the tool runs
+    with console.status(f"Downloading with {tool}...") as status:
+        with subprocess.Popen(
+            args, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, errors="replace"
+        ) as proc:
+            stderr_tail: deque[str] = deque(maxlen=STDERR_TAIL_LINES)
+            drain = threading.Thread(target=stderr_tail.extend, args=(proc.stderr,), daemon=True)
+            drain.start()
+
+            while proc.poll() is None:
+                files, size = _scan_directory(dest)
+                status.update(f"Downloading with {tool}... {files} files ({format_size(size)})")
+                time.sleep(1)
+
+            drain.join()
+
+    if proc.returncode != 0:
+        console.print(f"[yellow]{tool} failed, falling back to built-in downloader: {''.join(stderr_tail).strip()}[/]")
+        return False
+
+    files, size = _scan_directory(dest)
+    console.print(f"[green]✓ Downloaded {files} files ({format_size(size)})[/]")
+    return True
+
+
+def _scan_directory(path: Path) -> tuple[int, int]:
+    """Count files and their total size below a directory."""
+    files = 0
+    size = 0
+    stack = [path]
+
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.is_file(follow_symlinks=False):
+                    files += 1
+                    size += entry.stat(follow_symlinks=False).st_size
+
+    return files, size
 
 
 def _list_repos_in_backup(s3: S3Storage, backup_id: str) -> list[dict]:
-    """List repositories in a backup with their contents."""
-    prefix = f"{s3.prefix}/{backup_id}/"
-    response = s3.s3.list_objects_v2(
-        Bucket=s3.bucket, Prefix=prefix, Delimiter="/"
-    )
+    """List repositories in a backup with their contents.
+
+    Lists the backup folder of every repository concurrently and
+    classifies every key of the backup in one pass.
+    """
+    repos: dict[str, dict] = {}
+    for obj in s3.list_backup_objects(backup_id):
+        # Key structure: {prefix}/{repo}/{backup_id}/{file}
+        key = obj["Key"]
+        repo_name = key[len(s3.prefix) + 1:].partition("/")[0]
+
+        repo = repos.get(repo_name)
+        if repo is None:
+            repo = repos[repo_name] = {
+                "name": repo_name,
+                "has_bundle": False,
+                "has_lfs": False,
+                "has_wiki": False,
+                "has_metadata": False,
+            }
+
+        if key.endswith(".wiki.bundle"):
+            repo["has_wiki"] = True
+        elif key.endswith(".bundle"):
+            repo["has_bundle"] = True
+        elif key.endswith(".lfs.tar.gz"):
+            repo["has_lfs"] = True
+        else:
+            # Metadata exports are stored next to the bundles (issues.json, ...)
+            repo["has_metadata"] = True
+
+    return [repos[name] for name in sorted(repos)]
+
+
+def _download_artifacts(
+    s3: S3Storage,
+    backup_id: str,
+    repo_name: str,
+    settings: Settings,
+    include_wiki: bool = False,
+) -> tuple[Optional[Path], Optional[Path], Optional[Path]]:
+    """Download bundle, LFS archive and (optionally) wiki bundle concurrently.
 
-    repos = []
-    for prefix_obj in response.get("CommonPrefixes", []):
-        repo_prefix = prefix_obj["Prefix"]
-        repo_name = repo_prefix.rstrip("/").split("/")[-1]
+    Returns:
+        Tuple of (bundle_path, lfs_archive, wiki_bundle). Entries are None
+        if the artifact is not present in the backup.
+    """
+    known_keys = _list_artifact_keys(s3, backup_id, repo_name)
 
-        # Check what files exist
-        repo_contents = s3.s3.list_objects_v2(Bucket=s3.bucket, Prefix=repo_prefix)
-        files = [obj["Key"] for obj in repo_contents.get("Contents", [])]
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        bundle = executor.submit(_download_artifact, s3, backup_id, repo_name, ".bundle", settings, known_keys)
+        lfs = executor.submit(_download_artifact, s3, backup_id, repo_name, ".lfs.tar.gz", settings, known_keys)
+        wiki = executor.submit(
+            _download_artifact, s3, backup_id, repo_name, ".wiki.bundle", settings, known_keys
+        ) if include_wiki else None
 
-        repos.append({
-            "name": repo_name,
-            "has_bundle": any(f.endswith(".bundle") and "wiki" not in f for f in files),
-            "has_lfs": any(f.endswith(".lfs.tar.gz") for f in files),
-            "has_wiki": any("wiki.bundle" in f for f in files),
-            "has_metadata": any("metadata/" in f for f in files),
-        })
+        return bundle.result(), lfs.result(), wiki.result() if wiki else None
 
-    return repos
 
+def _restore_to_remote(
+    s3: S3Storage,
+    backup_id: str,
+    repo_name: str,
+    settings: Settings,
+    remote_url: str,
+    force: bool,
+    temp_dir: Path,
+    include_wiki: bool = False,
+) -> tuple[Optional[subprocess.CompletedProcess], Optional[subprocess.CompletedProcess], Optional[Path]]:
+    """Restore a repository from S3 to a remote, overlapping the transfers.
+
+    The bundle is streamed into a bare clone while the LFS archive and wiki
+    bundle download. The ref push starts as soon as the clone is ready, so
+    it runs while the LFS archive is still downloading and extracting. LFS
+    objects are pushed once both are done.
+
+    Args:
+        s3: S3 storage client.
+        backup_id: Backup ID.
+        repo_name: Repository name.
+        settings: Application settings.
+        remote_url: Target remote URL.
+        force: Mirror push (overwrites remote) instead of pushing all branches.
+        temp_dir: Directory for the bare clone (removed by the caller).
+        include_wiki: Also download the wiki bundle.
 
-def _download_bundle(s3: S3Storage, backup_id: str, repo_name: str, settings: Settings) -> Optional[Path]:
-    """Download a repository bundle from S3."""
-    key = f"{s3.prefix}/{backup_id}/{repo_name}/{repo_name}.bundle"
-    local_path = Path(settings.data_dir) / "temp" / f"{repo_name}.bundle"
-    local_path.parent.mkdir(parents=True, exist_ok=True)
+    Returns:
+        Tuple of (push_result, lfs_push_result, wiki_bundle). push_result is
+        None if the bundle does not exist, lfs_push_result is None if there
+        are no LFS objects or the ref push failed.
+    """
+    known_keys = _list_artifact_keys(s3, backup_id, repo_name)
+    succeeded = False
 
-    try:
-        s3.s3.download_file(s3.bucket, key, str(local_path))
-        return local_path
-    except Exception:
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        lfs = executor.submit(_download_artifact, s3, backup_id, repo_name, ".lfs.tar.gz", settings, known_keys)
+        wiki = executor.submit(
+            _download_artifact, s3, backup_id, repo_name, ".wiki.bundle", settings, known_keys
+        ) if include_wiki else None
+
+        try:
+            cloned = _clone_bare_from_s3(s3, backup_id, repo_name, settings, temp_dir)
+            push = executor.submit(_push_repository, temp_dir, remote_url, force) if cloned else None
+
+            lfs_archive = lfs.result()
+            wiki_bundle = wiki.result() if wiki else None
+
+            if not push:
+                return None, None, None
+
+            try:
+                if lfs_archive:
+                    _restore_lfs_objects(lfs_archive, temp_dir, bare=True)
+            finally:
+                _remove_files(lfs_archive)
+
+            result = push.result()
+
+            lfs_result = None
+            if lfs_archive and result.returncode == 0:
+                lfs_result = _run_quiet(["git", "lfs", "push", "--all", remote_url], cwd=temp_dir)
+
+            succeeded = True
+            return result, lfs_result, wiki_bundle
+        finally:
+            # Downloads live outside temp_dir, so remove them unless handed to the caller
+            if not succeeded:
+                _remove_files(_downloaded_file(lfs), _downloaded_file(wiki))
+
+
+def _list_artifact_keys(s3: S3Storage, backup_id: str, repo_name: str) -> set[str]:
+    """List the artifact keys of a repository in a backup.
+
+    One listing tells which artifacts exist, instead of a HEAD request per artifact.
+    """
+    return {obj["Key"] for obj in s3.list_objects(_artifact_key(s3, backup_id, repo_name, ""))}
+
+
+def _downloaded_file(future: Optional[Future]) -> Optional[Path]:
+    """Wait for an artifact download and get its file, or None if it failed."""
+    if future is None or future.exception() is not None:
         return None
+    return future.result()
+
 
+def _remove_files(*paths: Optional[Path]) -> None:
+    """Delete downloaded temporary files, ignoring missing entries."""
+    for path in paths:
+        if path:
+            path.unlink(missing_ok=True)
 
-def _download_wiki_bundle(s3: S3Storage, backup_id: str, repo_name: str, settings: Settings) -> Optional[Path]:
-    """Download a wiki bundle from S3."""
-    key = f"{s3.prefix}/{backup_id}/{repo_name}/{repo_name}.wiki.bundle"
-    local_path = Path(settings.data_dir) / "temp" / f"{repo_name}.wiki.bundle"
-    local_path.parent.mkdir(parents=True, exist_ok=True)
 
+def _object_exists(s3: S3Storage, key: str) -> bool:
+    """Check whether an object exists using a cheap HEAD request."""
     try:
-        s3.s3.download_file(s3.bucket, key, str(local_path))
-        return local_path
-    except Exception:
-        return None
+        s3.s3.head_object(Bucket=s3.bucket, Key=key)
+        return True
+    except ClientError as e:
+        if is_not_found(e):
+            return False
+        raise
+
+
+def _artifact_key(s3: S3Storage, backup_id: str, repo_name: str, suffix: str) -> str:
+    """Get the S3 key of a repository artifact in a backup."""
+    return f"{s3.prefix}/{repo_name}/{backup_id}/{repo_name}{suffix}"
+
+
+def _download_artifact(
+    s3: S3Storage,
+    backup_id: str,
+    repo_name: str,
+    suffix: str,
+    settings: Settings,
+    known_keys: Optional[set[str]] = None,
+) -> Optional[Path]:
+    """Download a backup artifact of a repository from S3.
+
+    Args:
+        s3: S3 storage client.
+        backup_id: Backup ID.
+        repo_name: Repository name.
+        suffix: Artifact file suffix (".bundle", ".wiki.bundle" or ".lfs.tar.gz").
+        settings: Application settings.
+        known_keys: Keys known to exist from a previous listing. If given,
+            no HEAD request is made to check for the artifact.
+
+    Returns:
+        Path to the downloaded file, or None if the artifact does not exist.
 
+    Raises:
+        ClientError: If S3 fails for any reason other than a missing object.
+    """
+    key = _artifact_key(s3, backup_id, repo_name, suffix)
+    exists = key in known_keys if known_keys is not None else _object_exists(s3, key)
+    if not exists:
+        return None
 
-def _download_lfs_archive(s3: S3Storage, backup_id: str, repo_name: str, settings: Settings) -> Optional[Path]:
-    """Download a LFS archive from S3."""
-    key = f"{s3.prefix}/{backup_id}/{repo_name}/{repo_name}.lfs.tar.gz"
-    local_path = Path(settings.data_dir) / "temp" / f"{repo_name}.lfs.tar.gz"
-    local_path.parent.mkdir(parents=True, exist_ok=True)
+    local_path = _temp_dir(settings.data_dir) / f"{repo_name}{suffix}"
 
     try:
-        s3.s3.download_file(s3.bucket, key, str(local_path))
+        s3.s3.download_file(s3.bucket, key, str(local_path), Config=s3.transfer_config)
         return local_path
-    except Exception:
-        return None
+    except ClientError as e:
+        local_path.unlink(missing_ok=True)
+        if is_not_found(e):
+            return None
+        raise
+
+
+@lru_cache(maxsize=None)
+def _temp_dir(data_dir: str) -> Path:
+    """Get the download directory for restore artifacts, creating it once."""
+    temp_dir = Path(data_dir) / "temp"
+    temp_dir.mkdir(parents=True, exist_ok=True)
+    return temp_dir
+
+
+def _restore_local_worker(
+    backup_id: str,
+    repo_name: str,
+    output_path: Path,
+    has_lfs: bool,
+) -> Optional[str]:
+    """Restore a single repository in a worker process.
 
+    Runs in a separate process, so settings and the S3 client are created
+    locally (boto3 clients cannot be shared across processes).
 
-def _restore_lfs_objects(lfs_archive: Path, repo_path: Path) -> bool:
+    Args:
+        backup_id: Backup ID.
+        repo_name: Repository name.
+        output_path: Target directory for the working tree.
+        has_lfs: Whether the backup listing contains an LFS archive.
+
+    Returns:
+        Error message, or None on success.
+    """
+    settings = get_settings()
+    s3 = S3Storage(settings)
+
+    # The caller's backup listing already tells which artifacts exist
+    known_keys = {_artifact_key(s3, backup_id, repo_name, ".bundle")}
+    if has_lfs:
+        known_keys.add(_artifact_key(s3, backup_id, repo_name, ".lfs.tar.gz"))
+
+    bundle_path = _download_artifact(s3, backup_id, repo_name, ".bundle", settings, known_keys)
+    if not bundle_path:
+        return "bundle not found in backup"
+
+    try:
+        _clone_from_bundle(bundle_path, output_path)
+    except subprocess.CalledProcessError as e:
+        return f"clone failed: {e.stderr.strip() if e.stderr else e}"
+    finally:
+        bundle_path.unlink(missing_ok=True)
+
+    lfs_archive = _download_artifact(s3, backup_id, repo_name, ".lfs.tar.gz", settings, known_keys)
+    if lfs_archive:
+        _restore_lfs_objects(lfs_archive, output_path)
+        lfs_archive.unlink(missing_ok=True)
+
+    return None
+
+
+def _restore_lfs_objects(lfs_archive: Path, repo_path: Path, bare: bool = False) -> bool:
     """Extract LFS objects and run git lfs checkout.
 
     Args:
         lfs_archive: Path to the .lfs.tar.gz archive.
         repo_path: Path to the cloned repository.
+        bare: Repository is bare; objects are only extracted (no checkout).
 
     Returns:
         True if LFS restore was successful.
     """
     try:
-        # Create .git/lfs/objects directory
-        lfs_objects_dir = repo_path / ".git" / "lfs" / "objects"
-        lfs_objects_dir.mkdir(parents=True, exist_ok=True)
+        # Create lfs/objects directory inside the git directory
+        git_dir = repo_path if bare else repo_path / ".git"
+        (git_dir / "lfs" / "objects").mkdir(parents=True, exist_ok=True)
+
+        # Archive entries are stored as lfs/objects/..., so extract into the git directory
+        _extract_tar_gz(lfs_archive, git_dir)
 
-        # Extract LFS archive to .git/lfs/objects
-        with tarfile.open(lfs_archive, "r:gz") as tar:
-            tar.extractall(path=lfs_objects_dir)
+        # Bare repositories have no working tree to check out
+        if bare:
+            return True
 
         # Run git lfs checkout to replace pointers with actual files
-        result = subprocess.run(
-            ["git", "lfs", "checkout"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True
-        )
+        result = _run_quiet(["git", "lfs", "checkout"], cwd=repo_path)
 
         if result.returncode != 0:
             console.print(f"[yellow]Warning: git lfs checkout returned error: {result.stderr}[/]")
@@ -506,55 +822,291 @@ def _restore_lfs_objects(lfs_archive: Path, repo_path: Path) -> bool:
         return False
 
 
-def _push_lfs_objects(repo_path: Path) -> bool:
-    """Push LFS objects to remote.
+def _extract_tar_gz(archive: Path, dest: Path) -> None:
+    """Extract a .tar.gz archive into a directory.
+
+    Uses native pigz (parallel gunzip) piped into tar when available. Falls
+    back to a streaming tarfile extraction with a large read buffer, which
+    avoids random seeks and small reads on multi-GB archives.
+
+    Only the fallback extracts members with the "data" filter, which rejects
+    absolute paths, links pointing outside dest and special files. Native
+    tar strips leading "/" from member names and is told not to restore
+    file ownership, but does not otherwise validate members.
+
+    Args:
+        archive: Path to the .tar.gz archive.
+        dest: Directory to extract into.
+
+    Raises:
+        RuntimeError: If native extraction fails.
+    """
+    if shutil.which("pigz") and shutil.which("tar"):
+        with subprocess.Popen(
+            ["pigz", "-dc", str(archive)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        ) as pigz:
+            tar = subprocess.run(
+                ["tar", "--no-same-owner", "-xf", "-", "-C", str(dest)],
+                stdin=pigz.stdout,
+                capture_output=True,
+                text=True,
+            )
+            pigz.stdout.close()
+            pigz_stderr = pigz.stderr.read().decode(errors="replace")
+
+        if pigz.returncode != 0 or tar.returncode != 0:
+            raise RuntimeError(f"tar extraction failed: {tar.stderr or pigz_stderr}")
+        return
+
+    with gzip.open(archive, "rb") as gz:
+        with io.BufferedReader(gz, buffer_size=1024 * 1024) as buffered:
+            with tarfile.open(fileobj=buffered, mode="r|") as tar:
+                for member in tar:
+                    tar.extract(member, path=dest, filter="data")
+
+
+def _push_repository(repo_path: Path, remote_url: str, force: bool) -> subprocess.CompletedProcess:
+    """Push all refs straight to the target URL.
+
+    Pushing to the URL directly avoids rewriting the origin remote first.
 
     Args:
         repo_path: Path to the repository.
+        remote_url: Target remote URL.
+        force: Mirror push (overwrites remote) instead of pushing all branches.
+
+    Returns:
+        Completed process of git push.
+    """
+    return _run_quiet(
+        ["git", "push", "--mirror" if force else "--all", remote_url],
+        cwd=repo_path,
+    )
+
+
+def _run_quiet(
+    args: list[str],
+    cwd: Optional[Path] = None,
+    env: Optional[dict[str, str]] = None,
+    check: bool = False,
+) -> subprocess.CompletedProcess:
+    """Run a command, discarding stdout and keeping only the tail of stderr.
+
+    Unlike capture_output=True, memory stays bounded no matter how much
+    output git or git-lfs produce for large repositories.
+
+    Args:
+        args: Command and arguments.
+        cwd: Working directory.
+        env: Environment variables.
+        check: Raise CalledProcessError on a non-zero exit code.
 
     Returns:
-        True if LFS push was successful.
+        Completed process with the last STDERR_TAIL_LINES lines of stderr.
     """
+    with subprocess.Popen(
+        args,
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+    ) as proc:
+        tail = deque(proc.stderr, maxlen=STDERR_TAIL_LINES)
+
+    result = subprocess.CompletedProcess(args, proc.returncode, None, "".join(tail))
+    if check:
+        result.check_returncode()
+    return result
+
+
+def _print_lfs_push_result(result: subprocess.CompletedProcess) -> None:
+    """Print the outcome of a git lfs push."""
+    if result.returncode != 0:
+        console.print(f"[yellow]Warning: git lfs push returned error: {result.stderr}[/]")
+    else:
+        console.print("[green]✓ LFS objects pushed[/]")
+
+
+def _clone_from_bundle(bundle_path: Path, output_path: Path, bare: bool = False) -> None:
+    """Clone a repository from a bundle file.
+
+    Args:
+        bundle_path: Path to the bundle file.
+        output_path: Target directory.
+        bare: Create a bare clone without a working tree (for push-only restores).
+    """
+    # Re-restoring into a previous restore: update it in place, which avoids
+    # deleting and rewriting every file of a large working tree
+    if not bare and _update_from_bundle(bundle_path, output_path):
+        return
+
+    if output_path.exists():
+        shutil.rmtree(output_path)
+
+    clone_args = ["git", "clone"]
+    if bare:
+        clone_args.append("--bare")
+
+    _run_quiet([*clone_args, str(bundle_path), str(output_path)], check=True)
+
+
+def _update_from_bundle(bundle_path: Path, repo_path: Path) -> bool:
+    """Update an existing clone of the same bundle to the bundle's state.
+
+    Only applies to working tree clones whose origin is this bundle path,
+    i.e. targets created by an earlier restore of the same repository.
+
+    Returns:
+        True if the repository was updated, False if a fresh clone is needed.
+    """
+    if not (repo_path / ".git").is_dir():
+        return False
+
+    origin = subprocess.run(
+        ["git", "config", "--get", "remote.origin.url"],
+        cwd=repo_path, capture_output=True, text=True,
+    )
+    if origin.stdout.strip() != str(bundle_path):
+        return False
+
     try:
-        result = subprocess.run(
-            ["git", "lfs", "push", "--all", "origin"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True
+        _run_quiet(
+            [
+                "git", "fetch", "--force", "--prune", "--update-head-ok", str(bundle_path),
+                "+refs/heads/*:refs/heads/*",
+                "+refs/heads/*:refs/remotes/origin/*",
+                "+refs/tags/*:refs/tags/*",
+            ],
+            cwd=repo_path, check=True,
         )
+        _run_quiet(["git", "reset", "--hard", "HEAD"], cwd=repo_path, check=True)
+        _run_quiet(["git", "clean", "-ffdxq"], cwd=repo_path, check=True)
+    except subprocess.CalledProcessError:
+        return False
 
-        if result.returncode != 0:
-            console.print(f"[yellow]Warning: git lfs push returned error: {result.stderr}[/]")
-            return False
+    return True
 
-        return True
 
-    except Exception as e:
-        console.print(f"[yellow]Warning: Failed to push LFS objects: {e}[/]")
-        return False
+def _clone_bare_from_s3(
+    s3: S3Storage,
+    backup_id: str,
+    repo_name: str,
+    settings: Settings,
+    output_path: Path,
+) -> Optional[Path]:
+    """Create a bare clone by streaming the bundle from S3 into git.
+
+    Avoids writing the bundle to disk and reading it back. Falls back to
+    downloading the bundle and cloning from the file if the stream cannot
+    be imported (e.g. an unsupported bundle format).
 
+    Returns:
+        Path to the bare repository, or None if the bundle does not exist.
+    """
+    key = _artifact_key(s3, backup_id, repo_name, ".bundle")
+
+    try:
+        body = s3.s3.get_object(Bucket=s3.bucket, Key=key)["Body"]
+    except ClientError as e:
+        if is_not_found(e):
+            return None
+        raise
+
+    try:
+        with body:
+            _import_bundle_stream(body, output_path)
+        return output_path
+    except (ValueError, subprocess.CalledProcessError):
+        pass
+
+    bundle_path = _download_artifact(s3, backup_id, repo_name, ".bundle", settings, {key})
+    if not bundle_path:
+        return None
+
+    try:
+        _clone_from_bundle(bundle_path, output_path, bare=True)
+    finally:
+        bundle_path.unlink(missing_ok=True)
+
+    return output_path
+
+
+def _import_bundle_stream(stream: BinaryIO, output_path: Path) -> None:
+    """Import a git bundle stream into a new bare repository.
+
+    Parses the bundle header, pipes the pack data into git index-pack and
+    creates the branches and tags a bare clone of the bundle would have.
+
+    Args:
+        stream: Readable stream positioned at the start of the bundle.
+        output_path: Target directory for the bare repository.
+
+    Raises:
+        ValueError: If the bundle format is not supported.
+        subprocess.CalledProcessError: If a git command fails.
+    """
+    header = stream.readline()
+    if header not in (b"# v2 git bundle\n", b"# v3 git bundle\n"):
+        raise ValueError(f"Unsupported bundle header: {header[:32]!r}")
+
+    refs: dict[str, str] = {}
+    while (line := stream.readline().rstrip(b"\n")):
+        if line.startswith(b"@"):
+            continue  # Capabilities (v3), e.g. object-format
+        if line.startswith(b"-"):
+            raise ValueError("Bundles with prerequisites are not supported")
+        sha, _, ref = line.decode().partition(" ")
+        refs[ref] = sha
 
-def _clone_from_bundle(bundle_path: Path, output_path: Path) -> None:
-    """Clone a repository from a bundle file."""
     if output_path.exists():
         shutil.rmtree(output_path)
 
+    subprocess.run(["git", "init", "--bare", "-q", str(output_path)], check=True, capture_output=True)
+
+    index_pack = subprocess.Popen(
+        ["git", "index-pack", "--stdin", "--fix-thin"],
+        cwd=output_path, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+    )
+    try:
+        shutil.copyfileobj(stream, index_pack.stdin, length=1 << 20)
+    except BrokenPipeError:
+        pass
+    finally:
+        index_pack.stdin.close()
+        stderr = index_pack.stderr.read()
+        if index_pack.wait() != 0:
+            raise subprocess.CalledProcessError(index_pack.returncode, index_pack.args, stderr=stderr)
+
+    # Same refs as a bare clone: branches and tags only
+    updates = "".join(
+        f"create {ref} {sha}\n" for ref, sha in refs.items()
+        if ref.startswith(("refs/heads/", "refs/tags/"))
+    )
     subprocess.run(
-        ["git", "clone", str(bundle_path), str(output_path)],
-        check=True, capture_output=True
+        ["git", "update-ref", "--stdin"],
+        cwd=output_path, input=updates.encode(), check=True, capture_output=True,
     )
 
+    # Point HEAD at the branch the bundle's HEAD refers to
+    head_sha = refs.get("HEAD")
+    branches = [ref for ref, sha in refs.items() if ref.startswith("refs/heads/") and sha == head_sha]
+    if branches:
+        head = next((b for b in ("refs/heads/main", "refs/heads/master") if b in branches), branches[0])
+        subprocess.run(["git", "symbolic-ref", "HEAD", head], cwd=output_path, check=True, capture_output=True)
+
 
 def _restore_wiki_to_github(
-    s3: S3Storage,
-    backup_id: str,
+    wiki_bundle: Optional[Path],
     repo_name: str,
     target_repo: str,
     settings: Settings,
     force: bool
 ) -> None:
-    """Restore wiki to GitHub."""
-    wiki_bundle = _download_wiki_bundle(s3, backup_id, repo_name, settings)
+    """Restore a previously downloaded wiki bundle to GitHub."""
     if not wiki_bundle:
         console.print("[yellow]Wiki not found in backup.[/]")
         return
@@ -562,16 +1114,10 @@ def _restore_wiki_to_github(
     temp_dir = Path(settings.data_dir) / "restore_temp" / f"{repo_name}.wiki"
 
     try:
-        _clone_from_bundle(wiki_bundle, temp_dir)
+        _clone_from_bundle(wiki_bundle, temp_dir, bare=True)
 
         remote_url = f"https://{settings.github_pat}@github.com/{target_repo}.wiki.git"
-        subprocess.run(
-            ["git", "remote", "set-url", "origin", remote_url],
-            cwd=temp_dir, check=True, capture_output=True
-        )
-
-        push_args = ["git", "push", "--mirror" if force else "--all", "origin"]
-        result = subprocess.run(push_args, cwd=temp_dir, capture_output=True, text=True)
+        result = _push_repository(temp_dir, remote_url, force)
 
         if result.returncode == 0:
             console.print(f"[green]✓ Wiki restored to {target_repo}.wiki[/]")
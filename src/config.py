@@ -5,11 +5,19 @@ Provides type-safe configuration using Pydantic Settings.
 All configuration is loaded from environment variables or .env file.
 """
 
+from functools import cached_property, lru_cache
+from pathlib import Path
 from typing import Literal, Optional
 
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import BaseSettings, PydanticBaseSettingsSource, SettingsConfigDict
 from pydantic import Field, field_validator
 
+# Valid cron day-of-week tokens (0=Mon, 6=Sun)
+_VALID_DAYS_OF_WEEK = frozenset("0123456")
+
+# Supported alert channels
+_VALID_ALERT_CHANNELS = frozenset({"email", "webhook", "teams"})
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -20,6 +28,25 @@ class Settings(BaseSettings):
         case_sensitive=False,
     )
 
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        """Load settings from init arguments, environment and .env only.
+
+        The .env source is skipped when the file does not exist (e.g. in the
+        container, where configuration comes from the environment), and the
+        unused secrets directory source is never consulted.
+        """
+        if Path(cls.model_config["env_file"]).is_file():
+            return init_settings, env_settings, dotenv_settings
+        return init_settings, env_settings
+
     # === GitHub Configuration ===
     github_owner: str = Field(
         description="Organization or username to backup"
@@ -51,6 +78,11 @@ class Settings(BaseSettings):
         ge=1,
         description="Number of backup copies to retain"
     )
+    backup_cleanup_interval: int = Field(
+        default=1,
+        ge=1,
+        description="Apply the retention policy every N backup runs that wrote new backups"
+    )
     backup_include_metadata: bool = Field(
         default=True,
         description="Include issues, PRs, and releases"
@@ -63,6 +95,20 @@ class Settings(BaseSettings):
         default=True,
         description="Only backup repositories that have changed since last backup"
     )
+    backup_parallelism: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Number of repositories backed up in parallel"
+    )
+    backup_stream_bundles: bool = Field(
+        default=False,
+        description="Stream git bundles directly to S3 instead of writing them to DATA_DIR first"
+    )
+    backup_mirror_cache: bool = Field(
+        default=False,
+        description="Keep mirror clones in DATA_DIR/mirrors between runs and only fetch changes"
+    )
 
     # === Scheduler Configuration ===
     backup_schedule_enabled: bool = Field(
@@ -102,13 +148,10 @@ class Settings(BaseSettings):
         """Validate day_of_week is valid cron format."""
         if v == "*":
             return v
-        try:
-            days = [int(d.strip()) for d in v.split(",")]
-            if not all(0 <= d <= 6 for d in days):
-                raise ValueError("Days must be 0-6")
-            return v
-        except ValueError:
+        days = {d.strip() for d in v.split(",")}
+        if not days <= _VALID_DAYS_OF_WEEK:
             raise ValueError("day_of_week must be '*' or comma-separated days 0-6 (0=Mon, 6=Sun)")
+        return ",".join(sorted(days))
 
     # === S3/MinIO Configuration ===
     s3_endpoint_url: Optional[str] = Field(
@@ -132,6 +175,10 @@ class Settings(BaseSettings):
         default="",
         description="Optional prefix/folder in S3 bucket (empty = store directly under {owner}/{repo}/)"
     )
+    s3_storage_class: str = Field(
+        default="",
+        description="Storage class for backup objects, e.g. STANDARD_IA (empty = provider default)"
+    )
     s3_multipart_threshold: int = Field(
         default=100 * 1024 * 1024,
         description="File size threshold for multipart upload in bytes (default: 100MB)"
@@ -140,6 +187,17 @@ class Settings(BaseSettings):
         default=50 * 1024 * 1024,
         description="Chunk size for multipart upload in bytes (default: 50MB)"
     )
+    s3_max_pool_connections: int = Field(
+        default=64,
+        ge=1,
+        description="Maximum number of pooled HTTP connections to S3 (bounds parallel S3 requests)"
+    )
+    s3_max_concurrency: int = Field(
+        default=10,
+        ge=1,
+        le=64,
+        description="Number of concurrent part transfers per file for managed uploads and downloads"
+    )
 
     # === Alerting Configuration ===
     alert_enabled: bool = Field(
@@ -215,24 +273,29 @@ class Settings(BaseSettings):
         """Validate alert channels."""
         if not v:
             return v
-        valid_channels = {"email", "webhook", "teams"}
         channels = [c.strip().lower() for c in v.split(",") if c.strip()]
-        invalid = set(channels) - valid_channels
+        invalid = set(channels) - _VALID_ALERT_CHANNELS
         if invalid:
-            raise ValueError(f"Invalid alert channels: {invalid}. Valid: {valid_channels}")
+            raise ValueError(f"Invalid alert channels: {invalid}. Valid: {set(_VALID_ALERT_CHANNELS)}")
         return ",".join(channels)
 
+    @cached_property
+    def alert_channels_list(self) -> tuple[str, ...]:
+        """Active alert channels, parsed once per Settings instance."""
+        return tuple(c.strip().lower() for c in self.alert_channels.split(",") if c.strip())
+
+    @cached_property
+    def smtp_recipients_list(self) -> tuple[str, ...]:
+        """SMTP recipients, parsed once per Settings instance."""
+        return tuple(r.strip() for r in self.smtp_to.split(",") if r.strip())
+
     def get_alert_channels(self) -> list[str]:
         """Get list of active alert channels."""
-        if not self.alert_channels:
-            return []
-        return [c.strip().lower() for c in self.alert_channels.split(",") if c.strip()]
+        return list(self.alert_channels_list)
 
     def get_smtp_recipients(self) -> list[str]:
         """Get list of SMTP recipients."""
-        if not self.smtp_to:
-            return []
-        return [r.strip() for r in self.smtp_to.split(",") if r.strip()]
+        return list(self.smtp_recipients_list)
 
     @property
     def is_authenticated(self) -> bool:
@@ -252,3 +315,41 @@ class Settings(BaseSettings):
         default="/data",
         description="Directory for local backup data"
     )
+
+
+# Modification time of the .env file when the cached settings were loaded
+_env_file_mtime: Optional[float] = None
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the application settings, loading them once per process.
+
+    Returns:
+        Cached Settings instance. Use get_settings.cache_clear() to reload.
+    """
+    global _env_file_mtime
+    _env_file_mtime = _get_env_file_mtime()
+    return Settings()
+
+
+def get_fresh_settings() -> Settings:
+    """Get the cached settings, reloading them if the .env file has changed.
+
+    Only costs a stat() call while the .env file is unchanged, so it can be
+    used on every scheduled run.
+
+    Returns:
+        Cached Settings instance, reloaded if .env was modified since loading.
+    """
+    if _get_env_file_mtime() != _env_file_mtime:
+        get_settings.cache_clear()
+    return get_settings()
+
+
+def _get_env_file_mtime() -> Optional[float]:
+    """Get the modification time of the .env file, or None if it is missing."""
+    try:
+        return Path(Settings.model_config["env_file"]).stat().st_mtime
+    except OSError:
+        return None
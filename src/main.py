@@ -5,24 +5,17 @@ GitHub Backup - Main Entry Point
 Automated backup of GitHub repositories to S3-compatible storage.
 """
 
-import logging
 import shutil
 import signal
 import sys
 import threading
 import time
-from datetime import datetime
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional
 
-from config import Settings
-from scheduler import setup_scheduler
-from sync_state_manager import SyncStateManager
-from alerting.manager import AlertManager
-from backup.github_client import GitHubBackupClient
-from backup.git_operations import GitBackup, BackupResult
-from backup.metadata_exporter import MetadataExporter
-from backup.wiki_backup import WikiBackup
-from storage.s3_client import S3Storage
+from config import Settings, get_settings
 from ui.console import (
     backup_logger,
     console,
@@ -30,22 +23,37 @@ from ui.console import (
     print_banner,
     print_completion,
     print_error,
-    print_repo_status,
+    format_repo_status,
+    print_repo_status_lines,
     print_summary,
     setup_logging,
     format_size,
 )
 
+# Backup service modules are imported where they are used, so that
+# 'main.py cli ...' does not pay for loading the scheduler, PyGithub and
+# GitPython before handing over to the CLI
+if TYPE_CHECKING:
+    from backup.git_operations import GitBackup
+    from backup.github_client import GitHubBackupClient, RepoInfo
+    from backup.metadata_exporter import MetadataExporter
+    from backup.wiki_backup import WikiBackup
+    from storage.s3_client import S3Storage
+    from sync_state_manager import RepoState, SyncStateManager
+
+# Suffix of work directories that are being deleted in the background
+_DELETING_SUFFIX = ".deleting"
+
 
 class ShutdownHandler:
     """Handles graceful shutdown on SIGTERM/SIGINT.
 
-    Allows the current repository backup to complete before exiting.
+    Allows the repository backups in progress to complete before exiting.
     """
 
     def __init__(self):
         self._shutdown_requested = threading.Event()
-        self._current_repo: str | None = None
+        self._current_repos: list[str] = []
         self._lock = threading.Lock()
 
     def request_shutdown(self, signum: int, frame) -> None:
@@ -54,10 +62,10 @@ class ShutdownHandler:
         backup_logger.debug(f"Received {signal_name}, initiating graceful shutdown...")
 
         with self._lock:
-            if self._current_repo:
+            if self._current_repos:
                 console.print(
                     f"\n[yellow]Shutdown requested - completing backup of "
-                    f"[cyan]{self._current_repo}[/] before exit...[/]"
+                    f"[cyan]{', '.join(self._current_repos)}[/] before exit...[/]"
                 )
             else:
                 console.print("\n[yellow]Shutdown requested - stopping...[/]")
@@ -68,22 +76,59 @@ class ShutdownHandler:
         """Check if shutdown has been requested."""
         return self._shutdown_requested.is_set()
 
-    def set_current_repo(self, repo_name: str | None) -> None:
-        """Set the currently processing repository name."""
+    def wait_for_shutdown(self, timeout: Optional[float] = None) -> bool:
+        """Block until shutdown is requested or the timeout expires.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits forever).
+
+        Returns:
+            True if shutdown was requested, False on timeout.
+        """
+        return self._shutdown_requested.wait(timeout)
+
+    def add_current_repo(self, repo_name: str) -> None:
+        """Mark a repository as currently being processed."""
         with self._lock:
-            self._current_repo = repo_name
+            self._current_repos.append(repo_name)
 
-    def get_current_repo(self) -> str | None:
-        """Get the currently processing repository name."""
+    def remove_current_repo(self, repo_name: str) -> None:
+        """Mark a repository as no longer being processed."""
         with self._lock:
-            return self._current_repo
+            self._current_repos.remove(repo_name)
+
+    def get_current_repos(self) -> list[str]:
+        """Get the names of the repositories currently being processed."""
+        with self._lock:
+            return list(self._current_repos)
+
+
+@dataclass(slots=True)
+class BackupStats:
+    """Statistics collected during a backup run."""
+
+    repos: int = 0
+    skipped: int = 0
+    issues: int = 0
+    prs: int = 0
+    releases: int = 0
+    wikis: int = 0
+    total_size: int = 0
+    errors: int = 0
+    lfs_repos: int = 0
+    deleted_backups: int = 0
+    shutdown_skipped: int = 0
 
 
 # Global shutdown handler instance
 shutdown_handler = ShutdownHandler()
 
 
-def run_backup(settings: Settings) -> bool:
+def run_backup(
+    settings: Settings,
+    s3_storage: Optional["S3Storage"] = None,
+    state_manager: Optional["SyncStateManager"] = None,
+) -> bool:
     """Execute a backup of repositories.
 
     If incremental mode is enabled, only repositories that have changed
@@ -91,31 +136,34 @@ def run_backup(settings: Settings) -> bool:
 
     Args:
         settings: Application settings.
+        s3_storage: Optional S3Storage instance to reuse. Created if not provided.
+        state_manager: Optional SyncStateManager instance to reuse. Created if
+            not provided.
 
     Returns:
         True if backup completed successfully.
     """
+    from alerting.manager import AlertManager
+    from backup.git_operations import GitBackup
+    from backup.github_client import GitHubBackupClient
+    from backup.metadata_exporter import MetadataExporter
+    from backup.wiki_backup import WikiBackup
+    from storage.s3_client import S3Storage
+    from sync_state_manager import SyncStateManager
+
     start_time = time.time()
-    backup_id = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    backup_id = time.strftime("%Y-%m-%d_%H-%M-%S")
     work_dir = Path(settings.data_dir) / backup_id
 
     # Initialize state manager for incremental backup tracking
-    state_manager = SyncStateManager(settings.data_dir)
+    if state_manager is None:
+        state_manager = SyncStateManager(settings.data_dir)
 
     # Initialize alert manager
     alert_manager = AlertManager(settings)
 
     # Initialize statistics
-    stats = {
-        "repos": 0,
-        "skipped": 0,
-        "issues": 0,
-        "prs": 0,
-        "releases": 0,
-        "wikis": 0,
-        "total_size": 0,
-        "errors": 0,
-    }
+    stats = BackupStats()
 
     # Collect error messages for alerting
     error_messages = []
@@ -124,7 +172,8 @@ def run_backup(settings: Settings) -> bool:
         # Initialize clients
         console.print("\n[dim]Initializing...[/]")
         gh_client = GitHubBackupClient(settings)
-        s3_storage = S3Storage(settings)
+        if s3_storage is None:
+            s3_storage = S3Storage(settings)
 
         # Ensure bucket exists
         if not s3_storage.ensure_bucket_exists():
@@ -132,7 +181,8 @@ def run_backup(settings: Settings) -> bool:
             return False
 
         # Connect state manager to S3 for persistence
-        state_manager.set_s3_storage(s3_storage)
+        if state_manager.s3_storage is None:
+            state_manager.set_s3_storage(s3_storage)
 
         # Get repositories
         console.print(f"[dim]Fetching repositories for {settings.github_owner}...[/]")
@@ -144,18 +194,15 @@ def run_backup(settings: Settings) -> bool:
             return True
 
         # Check which repos need backup (if incremental mode)
-        repos_to_backup = []
         if settings.backup_incremental:
-            for repo_info in repos:
-                if state_manager.has_repo_changed(repo_info.name, repo_info.pushed_at):
-                    repos_to_backup.append(repo_info)
-                else:
-                    stats["skipped"] += 1
+            known = state_manager.get_all_states()
+            repos_to_backup = [r for r in repos if known.get(r.name) != r.pushed_at]
+            stats.skipped = total_repos - len(repos_to_backup)
 
             console.print(
                 f"[green]Found {total_repos} repositories, "
                 f"{len(repos_to_backup)} changed, "
-                f"{stats['skipped']} unchanged[/]\n"
+                f"{stats.skipped} unchanged[/]\n"
             )
         else:
             repos_to_backup = repos
@@ -166,18 +213,23 @@ def run_backup(settings: Settings) -> bool:
             console.print("[green]All repositories are up to date, no backup needed[/]")
             # Print summary even when skipping
             duration = time.time() - start_time
-            print_summary(stats, duration)
+            print_summary(asdict(stats), duration)
             print_completion(True)
             return True
 
         # Print banner only if we have work to do
         print_banner(backup_id)
 
+        # Remove work directories left behind by interrupted cleanups
+        for stale_dir in Path(settings.data_dir).glob(f"*{_DELETING_SUFFIX}"):
+            _remove_work_dir_in_background(stale_dir)
+
         # Ensure work directory exists
         work_dir.mkdir(parents=True, exist_ok=True)
 
         # Initialize backup components
-        git_backup = GitBackup(work_dir)
+        mirror_cache_dir = Path(settings.data_dir) / "mirrors" if settings.backup_mirror_cache else None
+        git_backup = GitBackup(work_dir, mirror_cache_dir=mirror_cache_dir)
         metadata_exporter = MetadataExporter(work_dir)
         wiki_backup = WikiBackup(git_backup)
 
@@ -185,103 +237,60 @@ def run_backup(settings: Settings) -> bool:
         shutdown_early = False
         repos_remaining = 0
 
-        # Process repositories with progress bar
-        with create_progress() as progress:
+        # Process repositories in parallel with progress bar. New repositories
+        # are only submitted while no shutdown is requested, so a shutdown
+        # lets the backups in progress finish and skips the rest.
+        # Uploads run in a separate pool and are tracked here, so a worker is
+        # free to clone the next repository while the previous one uploads.
+        # At most twice as many repositories as workers are in flight, which
+        # bounds the disk space used by files waiting for upload.
+        parallelism = settings.backup_parallelism
+        max_in_flight = 2 * parallelism
+        backups: dict[Future, "RepoInfo"] = {}
+        uploads: dict[Future, str] = {}
+        # Repositories waiting for uploads: name -> (repo info, stats, pending uploads)
+        uploading: dict[str, tuple["RepoInfo", dict, set[Future]]] = {}
+        status_lines: list[str] = []
+        repos_iter = iter(repos_to_backup)
+        submitted = 0
+        shutdown_requested = shutdown_handler.is_shutdown_requested
+
+        with (
+            create_progress() as progress,
+            ThreadPoolExecutor(max_workers=parallelism) as executor,
+            ThreadPoolExecutor(max_workers=parallelism, thread_name_prefix="upload") as uploader,
+        ):
             task = progress.add_task("Backing up repositories", total=len(repos_to_backup))
 
-            for idx, repo_info in enumerate(repos_to_backup):
-                # Check for shutdown request before starting new repo
-                if shutdown_handler.is_shutdown_requested():
-                    repos_remaining = len(repos_to_backup) - idx
-                    shutdown_early = True
-                    console.print(
-                        f"\n[yellow]Shutdown: Skipping {repos_remaining} remaining "
-                        f"repositories[/]"
-                    )
-                    break
-
+            def record_result(repo_info: "RepoInfo", repo_stats: dict) -> None:
+                """Record a finished repository (only called from this thread)."""
                 repo_name = repo_info.name
-                shutdown_handler.set_current_repo(repo_name)
-
-                repo_stats = {
-                    "git_size": None,
-                    "lfs_size": None,
-                    "has_lfs": False,
-                    "issues": None,
-                    "prs": None,
-                    "releases": None,
-                    "wiki": None,
-                    "error": None,
-                }
-
-                try:
-                    # Backup git repository (including LFS if present)
-                    clone_url = gh_client.get_clone_url(repo_info)
-                    backup_result = git_backup.clone_and_bundle(
-                        clone_url, repo_name
-                    )
-
-                    if backup_result.is_empty:
-                        # Empty repository - no commits
-                        repo_stats["git_size"] = "empty"
-                    elif backup_result.bundle_path is not None:
-                        repo_stats["git_size"] = format_size(backup_result.bundle_size)
-                        stats["total_size"] += backup_result.bundle_size
-                        # Upload bundle to S3
-                        s3_storage.upload_file(backup_result.bundle_path, backup_id, repo_name)
-
-                        # Upload LFS archive if present
-                        if backup_result.lfs_path is not None:
-                            repo_stats["has_lfs"] = True
-                            repo_stats["lfs_size"] = format_size(backup_result.lfs_size)
-                            stats["total_size"] += backup_result.lfs_size
-                            stats["lfs_repos"] = stats.get("lfs_repos", 0) + 1
-                            s3_storage.upload_file(backup_result.lfs_path, backup_id, repo_name)
-
-                    # Backup metadata (use underlying repo object)
-                    if settings.backup_include_metadata:
-                        meta_counts = metadata_exporter.export_all(repo_info.repo)
-                        repo_stats["issues"] = meta_counts["issues"]
-                        repo_stats["prs"] = meta_counts["prs"]
-                        repo_stats["releases"] = meta_counts["releases"]
-                        stats["issues"] += meta_counts["issues"]
-                        stats["prs"] += meta_counts["prs"]
-                        stats["releases"] += meta_counts["releases"]
-
-                        # Upload metadata to S3
-                        metadata_dir = work_dir / repo_name / "metadata"
-                        if metadata_dir.exists():
-                            s3_storage.upload_directory(metadata_dir, backup_id, repo_name)
-
-                    # Backup wiki
-                    if settings.backup_include_wiki:
-                        wiki_url = gh_client.get_wiki_url(repo_info)
-                        wiki_path, wiki_size = wiki_backup.backup_wiki(wiki_url, repo_name)
-                        if wiki_path:
-                            repo_stats["wiki"] = True
-                            stats["wikis"] += 1
-                            stats["total_size"] += wiki_size
-                            s3_storage.upload_file(wiki_path, backup_id, repo_name)
-                        else:
-                            repo_stats["wiki"] = False
 
-                    stats["repos"] += 1
+                stats.total_size += repo_stats["total_size"]
+                stats.issues += repo_stats["issues"] or 0
+                stats.prs += repo_stats["prs"] or 0
+                stats.releases += repo_stats["releases"] or 0
+                if repo_stats["has_lfs"]:
+                    stats.lfs_repos += 1
+                if repo_stats["wiki"]:
+                    stats.wikis += 1
+
+                if repo_stats["error"]:
+                    stats.errors += 1
+                    error_messages.append(f"{repo_name}: {repo_stats['error']}")
+                else:
+                    stats.repos += 1
 
                     # Update repo state after successful backup
-                    state_manager.update_repo_state(
+                    state_manager.update_repo_state_in_memory(
                         repo_name=repo_name,
                         pushed_at=repo_info.pushed_at,
                         backup_id=backup_id,
+                        refs_digest=repo_stats["refs_digest"],
                     )
 
-                except Exception as e:
-                    backup_logger.debug(f"Failed to backup {repo_name}: {e}")
-                    repo_stats["error"] = str(e)
-                    stats["errors"] += 1
-                    error_messages.append(f"{repo_name}: {e}")
-
-                # Print status for this repo
-                print_repo_status(
+                # Status lines are printed once per batch of finished repos
+                status_lines.append(format_repo_status(
                     repo_name,
                     git_size=repo_stats["git_size"],
                     has_lfs=repo_stats["has_lfs"],
@@ -291,35 +300,103 @@ def run_backup(settings: Settings) -> bool:
                     releases=repo_stats["releases"],
                     wiki=repo_stats["wiki"],
                     error=repo_stats["error"],
-                )
+                ))
 
                 # Clear current repo tracking
-                shutdown_handler.set_current_repo(None)
+                shutdown_handler.remove_current_repo(repo_name)
 
                 progress.advance(task)
 
-        # Cleanup old backups (smart retention - preserves last backup per repo)
-        # Skip if shutting down to exit faster
-        if not shutdown_early:
-            console.print("\n[dim]Checking retention policy...[/]")
-            deleted_count = s3_storage.cleanup_old_backups(
-                state_manager.get_backed_up_repos()
+            while True:
+                while (
+                    len(backups) < parallelism
+                    and len(backups) + len(uploading) < max_in_flight
+                    and not shutdown_requested()
+                ):
+                    repo_info = next(repos_iter, None)
+                    if repo_info is None:
+                        break
+
+                    shutdown_handler.add_current_repo(repo_info.name)
+                    future = executor.submit(
+                        _backup_repository,
+                        repo_info, backup_id, work_dir, settings,
+                        gh_client, s3_storage, uploader, git_backup, metadata_exporter, wiki_backup,
+                        state_manager.get_repo_state(repo_info.name),
+                    )
+                    backups[future] = repo_info
+                    submitted += 1
+
+                if not backups and not uploads:
+                    break
+
+                done, _ = wait([*backups, *uploads], return_when=FIRST_COMPLETED)
+
+                # Shared statistics and state are only updated from this thread
+                for future in done:
+                    if future in backups:
+                        repo_info = backups.pop(future)
+                        repo_stats, repo_uploads = future.result()
+                        if repo_uploads:
+                            uploading[repo_info.name] = (repo_info, repo_stats, set(repo_uploads))
+                            for upload in repo_uploads:
+                                uploads[upload] = repo_info.name
+                        else:
+                            record_result(repo_info, repo_stats)
+                        continue
+
+                    # The backup only counts as successful once everything is uploaded
+                    repo_name = uploads.pop(future)
+                    repo_info, repo_stats, remaining = uploading[repo_name]
+                    remaining.discard(future)
+                    error = future.exception()
+                    if error is not None and not repo_stats["error"]:
+                        backup_logger.debug(f"Failed to upload {repo_name}: {error}")
+                        repo_stats["error"] = str(error)
+                    if not remaining:
+                        del uploading[repo_name]
+                        record_result(repo_info, repo_stats)
+
+                print_repo_status_lines(status_lines)
+                status_lines.clear()
+
+        # Save the state of all backed up repositories at once
+        state_manager.flush()
+
+        if submitted < len(repos_to_backup):
+            repos_remaining = len(repos_to_backup) - submitted
+            shutdown_early = True
+            console.print(
+                f"\n[yellow]Shutdown: Skipped {repos_remaining} remaining "
+                f"repositories[/]"
             )
-            if deleted_count > 0:
-                stats["deleted_backups"] = deleted_count
 
-        # Cleanup local work directory
+        # Cleanup old backups (smart retention - preserves last backup per repo)
+        # Skip if shutting down to exit faster, or if no new backups were written
+        if not shutdown_early and stats.repos > 0:
+            backups_since_cleanup = state_manager.increment_backups_since_cleanup()
+            if backups_since_cleanup >= settings.backup_cleanup_interval:
+                console.print("\n[dim]Checking retention policy...[/]")
+                deleted_count = s3_storage.cleanup_old_backups(
+                    state_manager.get_backed_up_repos()
+                )
+                if deleted_count > 0:
+                    stats.deleted_backups = deleted_count
+                state_manager.reset_backups_since_cleanup()
+            state_manager.flush()
+
+        # Cleanup local work directory without delaying summary and alerts
         console.print("[dim]Cleaning up local files...[/]")
-        shutil.rmtree(work_dir, ignore_errors=True)
+        _remove_work_dir_in_background(work_dir)
 
         # Print summary
         duration = time.time() - start_time
         if shutdown_early:
-            stats["shutdown_skipped"] = repos_remaining
-        print_summary(stats, duration)
+            stats.shutdown_skipped = repos_remaining
+        print_summary(asdict(stats), duration)
 
         # Print completion status
-        success = stats["errors"] == 0
+        success = stats.errors == 0
         if shutdown_early:
             console.print("\n[yellow]Backup stopped early due to shutdown request[/]")
         print_completion(success)
@@ -329,15 +406,15 @@ def run_backup(settings: Settings) -> bool:
         if success:
             alert_results = alert_manager.send_backup_success(
                 backup_id=backup_id,
-                stats=stats,
+                stats=asdict(stats),
                 duration_seconds=duration,
                 github_owner=settings.github_owner,
             )
-        elif stats["repos"] > 0:
+        elif stats.repos > 0:
             # Partial success with some errors
             alert_results = alert_manager.send_backup_warning(
                 backup_id=backup_id,
-                stats=stats,
+                stats=asdict(stats),
                 duration_seconds=duration,
                 warning_messages=error_messages,
                 github_owner=settings.github_owner,
@@ -347,7 +424,7 @@ def run_backup(settings: Settings) -> bool:
             alert_results = alert_manager.send_backup_error(
                 backup_id=backup_id,
                 error_message="All repository backups failed",
-                stats=stats,
+                stats=asdict(stats),
                 duration_seconds=duration,
                 error_messages=error_messages,
                 github_owner=settings.github_owner,
@@ -371,18 +448,214 @@ def run_backup(settings: Settings) -> bool:
         alert_manager.send_backup_error(
             backup_id=backup_id,
             error_message=str(e),
-            stats=stats,
+            stats=asdict(stats),
             duration_seconds=duration,
             error_messages=error_messages,
             github_owner=settings.github_owner,
         )
 
+        # Keep the state of repositories backed up before the failure
+        state_manager.flush()
+
         # Cleanup on error
         if work_dir.exists():
             shutil.rmtree(work_dir, ignore_errors=True)
         return False
 
 
+def _remove_work_dir_in_background(work_dir: Path) -> None:
+    """Delete a work directory in a background thread.
+
+    The directory is renamed first, so the deletion never collides with a
+    new backup using the same path. If the process exits before the thread
+    finishes, the renamed directory is removed by the next backup run.
+
+    Args:
+        work_dir: Work directory to delete.
+    """
+    if work_dir.name.endswith(_DELETING_SUFFIX):
+        trash_dir = work_dir
+    else:
+        trash_dir = work_dir.with_name(work_dir.name + _DELETING_SUFFIX)
+        try:
+            work_dir.rename(trash_dir)
+        except OSError:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            return
+
+    threading.Thread(
+        target=shutil.rmtree,
+        args=(trash_dir,),
+        kwargs={"ignore_errors": True},
+        name="cleanup",
+        daemon=True,
+    ).start()
+
+
+def _upload_and_remove(
+    upload: Callable[[Path, str, str], object],
+    path: Path,
+    backup_id: str,
+    repo_name: str,
+) -> None:
+    """Upload a backup file or directory and delete it locally afterwards.
+
+    Keeps local disk usage down to the files still waiting for upload, and
+    leaves little for the final work directory cleanup.
+
+    Args:
+        upload: S3Storage upload method to call with (path, backup_id, repo_name).
+        path: File or directory to upload.
+        backup_id: ID of the running backup.
+        repo_name: Name of the repository.
+    """
+    upload(path, backup_id, repo_name)
+    if path.is_dir():
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        path.unlink(missing_ok=True)
+
+
+def _backup_repository(
+    repo_info: "RepoInfo",
+    backup_id: str,
+    work_dir: Path,
+    settings: Settings,
+    gh_client: "GitHubBackupClient",
+    s3_storage: "S3Storage",
+    uploader: ThreadPoolExecutor,
+    git_backup: "GitBackup",
+    metadata_exporter: "MetadataExporter",
+    wiki_backup: "WikiBackup",
+    previous_state: Optional["RepoState"] = None,
+) -> tuple[dict, list[Future]]:
+    """Backup a single repository (git, LFS, metadata, wiki) and upload it.
+
+    Runs in a worker thread of run_backup and does not modify shared state.
+    Uploads are submitted to the upload pool as soon as each file is ready
+    and are not awaited, so the worker can start on the next repository.
+
+    Args:
+        repo_info: Repository to back up.
+        backup_id: ID of the running backup.
+        work_dir: Local working directory of the backup.
+        settings: Application settings.
+        gh_client: GitHub client.
+        s3_storage: S3 storage client.
+        uploader: Executor the S3 uploads are submitted to.
+        git_backup: Git backup handler.
+        metadata_exporter: Metadata exporter.
+        wiki_backup: Wiki backup handler.
+        previous_state: State of the last backup of the repository, used to
+            copy its bundle within S3 if no ref has changed since.
+
+    Returns:
+        Tuple of (per-repository statistics, submitted uploads). "error" is
+        set in the statistics if the backup failed; the repository is only
+        backed up once all uploads have succeeded.
+    """
+    repo_name = repo_info.name
+
+    repo_stats = {
+        "git_size": None,
+        "lfs_size": None,
+        "has_lfs": False,
+        "issues": None,
+        "prs": None,
+        "releases": None,
+        "wiki": None,
+        "error": None,
+        "total_size": 0,
+        "refs_digest": None,
+    }
+
+    uploads: list[Future] = []
+
+    try:
+        # Backup git repository (including LFS if present)
+        clone_url = gh_client.get_clone_url(repo_info)
+        bundle_sink = None
+        if settings.backup_stream_bundles:
+            # Upload the bundle while git writes it instead of staging it on disk
+            def bundle_sink(stream):
+                s3_storage.upload_stream(stream, f"{repo_name}.bundle", backup_id, repo_name)
+
+        reuse_bundle = None
+        if previous_state and previous_state.refs_digest and previous_state.last_backup_id:
+            # Copy the last bundle within S3 instead of bundling unchanged refs again
+            def reuse_bundle(refs_digest):
+                if refs_digest != previous_state.refs_digest:
+                    return None
+                return s3_storage.copy_file(
+                    f"{repo_name}.bundle", previous_state.last_backup_id, backup_id, repo_name
+                )
+
+        backup_result = git_backup.clone_and_bundle(
+            clone_url, repo_name, bundle_sink=bundle_sink, reuse_bundle=reuse_bundle
+        )
+        repo_stats["refs_digest"] = backup_result.refs_digest
+
+        if backup_result.is_empty:
+            # Empty repository - no commits
+            repo_stats["git_size"] = "empty"
+        elif (
+            backup_result.bundle_path is not None
+            or backup_result.bundle_streamed
+            or backup_result.bundle_reused
+        ):
+            repo_stats["git_size"] = format_size(backup_result.bundle_size)
+            repo_stats["total_size"] += backup_result.bundle_size
+            # Upload bundle to S3
+            if backup_result.bundle_path is not None:
+                uploads.append(uploader.submit(_upload_and_remove, s3_storage.upload_file, backup_result.bundle_path, backup_id, repo_name))
+
+            # Upload LFS archive if present
+            if backup_result.lfs_path is not None:
+                repo_stats["has_lfs"] = True
+                repo_stats["lfs_size"] = format_size(backup_result.lfs_size)
+                repo_stats["total_size"] += backup_result.lfs_size
+                uploads.append(uploader.submit(_upload_and_remove, s3_storage.upload_file, backup_result.lfs_path, backup_id, repo_name))
+
+        # Backup metadata (use underlying repo object)
+        if settings.backup_include_metadata:
+            # Skip REST exports for metadata types the repository has none of
+            known_counts = gh_client.get_metadata_counts(repo_info)
+            if known_counts is None:
+                meta_counts = metadata_exporter.export_all(repo_info.repo)
+            else:
+                meta_counts = metadata_exporter.export_all(
+                    repo_info.repo,
+                    skip_issues=known_counts["issues"] == 0,
+                    skip_prs=known_counts["prs"] == 0,
+                    skip_releases=known_counts["releases"] == 0,
+                )
+            repo_stats["issues"] = meta_counts["issues"]
+            repo_stats["prs"] = meta_counts["prs"]
+            repo_stats["releases"] = meta_counts["releases"]
+
+            # Upload metadata to S3
+            metadata_dir = work_dir / repo_name / "metadata"
+            if metadata_dir.exists():
+                uploads.append(uploader.submit(_upload_and_remove, s3_storage.upload_directory, metadata_dir, backup_id, repo_name))
+
+        # Backup wiki
+        if settings.backup_include_wiki:
+            wiki_url = gh_client.get_wiki_url(repo_info)
+            wiki_path, wiki_size = wiki_backup.backup_wiki(wiki_url, repo_name)
+            if wiki_path:
+                repo_stats["wiki"] = True
+                repo_stats["total_size"] += wiki_size
+                uploads.append(uploader.submit(_upload_and_remove, s3_storage.upload_file, wiki_path, backup_id, repo_name))
+            else:
+                repo_stats["wiki"] = False
+
+    except Exception as e:
+        backup_logger.debug(f"Failed to backup {repo_name}: {e}")
+        repo_stats["error"] = str(e)
+
+    return repo_stats, uploads
+
+
 def main() -> int:
     """Main entry point.
 
@@ -397,13 +670,18 @@ def main() -> int:
         app()
         return 0
 
+    from alerting.manager import AlertManager
+    from scheduler import setup_scheduler
+    from storage.s3_client import S3Storage
+    from sync_state_manager import SyncStateManager
+
     # Register signal handlers for graceful shutdown
     signal.signal(signal.SIGTERM, shutdown_handler.request_shutdown)
     signal.signal(signal.SIGINT, shutdown_handler.request_shutdown)
 
     try:
-        # Load settings
-        settings = Settings()
+        # Load settings (parsed once per process)
+        settings = get_settings()
 
         # Setup logging
         setup_logging(settings.log_level)
@@ -418,7 +696,7 @@ def main() -> int:
                     console.print(f"  [yellow]• {error}[/]")
                 console.print()
 
-            if not settings.get_alert_channels():
+            if not settings.alert_channels_list:
                 console.print(
                     "[yellow]Warning: ALERT_ENABLED=true but no ALERT_CHANNELS configured[/]\n"
                 )
@@ -426,17 +704,31 @@ def main() -> int:
         # Check for --now flag (immediate execution)
         if "--now" in sys.argv:
             console.print("[bold]Running backup immediately...[/]\n")
-            success = run_backup(settings)
-            # Update sync state on successful backup
-            if success:
-                s3_storage = S3Storage(settings)
-                state_manager = SyncStateManager(settings.data_dir, s3_storage)
-                state_manager.update_sync_time()
+            s3_storage = S3Storage(settings)
+            state_manager = SyncStateManager(settings.data_dir, s3_storage)
+            with state_manager.batch_update():
+                success = run_backup(settings, s3_storage=s3_storage, state_manager=state_manager)
+                # Update sync state on successful backup
+                if success:
+                    state_manager.update_sync_time()
             return 0 if success else 1
 
         # Start scheduler for continuous operation
         console.print("[bold]Starting GitHub Backup Service[/]\n")
-        scheduler = setup_scheduler(settings, lambda: run_backup(settings))
+        def scheduled_backup() -> bool:
+            """Run a scheduled backup with the scheduler's current settings.
+
+            The scheduler reloads the settings when .env changes and keeps
+            its S3 client (and its open connections) and sync state for all
+            runs with the same settings.
+            """
+            return run_backup(
+                scheduler.settings,
+                s3_storage=scheduler.s3_storage,
+                state_manager=scheduler.state_manager,
+            )
+
+        scheduler = setup_scheduler(settings, scheduled_backup)
         scheduler.start()
 
         return 0
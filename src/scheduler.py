@@ -6,17 +6,27 @@ Provides scheduled backup execution using APScheduler v4 with state persistence.
 
 import signal
 import sys
+from datetime import timedelta
+from functools import cached_property
 from typing import Callable
 
 from apscheduler import Scheduler, Event, JobReleased
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
-from config import Settings
+from config import Settings, get_fresh_settings
 from storage.s3_client import S3Storage
 from sync_state_manager import SyncStateManager
 from ui.console import backup_logger, console
 
+# Lease on schedules and jobs in the in-memory data store. APScheduler wakes up
+# every half lease to extend job leases even while idle; leases only matter when
+# several schedulers share a data store, so a long lease keeps the daemon idle.
+SCHEDULER_LEASE_DURATION = timedelta(hours=1)
+
+# Cron day-of-week names (0=Mon, 6=Sun)
+_DAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
 
 class BackupScheduler:
     """Manages scheduled backup execution with state persistence."""
@@ -36,12 +46,32 @@ class BackupScheduler:
         self.s3_storage = S3Storage(settings)
         self.state_manager = SyncStateManager(settings.data_dir, self.s3_storage)
 
+    def _refresh_settings(self) -> None:
+        """Pick up .env changes before a scheduled run.
+
+        If the settings were reloaded, the S3 client and state manager are
+        recreated once and replace the previous ones, so later runs reuse
+        them again. The schedule itself is not changed.
+        """
+        settings = get_fresh_settings()
+        if settings is self.settings:
+            return
+
+        backup_logger.debug("Settings changed, recreating S3 client and state manager")
+        self.settings = settings
+        self.s3_storage = S3Storage(settings)
+        self.state_manager = SyncStateManager(settings.data_dir, self.s3_storage)
+
     def _run_backup_with_state(self) -> None:
         """Run backup and update sync state on success."""
         try:
-            success = self.backup_func()
+            self._refresh_settings()
+            # Save the run's repository state and sync time with one upload
+            with self.state_manager.batch_update():
+                success = self.backup_func()
+                if success:
+                    self.state_manager.update_sync_time()
             if success:
-                self.state_manager.update_sync_time()
                 backup_logger.debug("Sync state updated after successful backup")
         except Exception as e:
             backup_logger.debug(f"Backup execution failed: {e}")
@@ -98,20 +128,15 @@ class BackupScheduler:
                 minute=minute,
             )
 
-    def _get_schedule_description(self) -> str:
-        """Get human-readable schedule description.
-
-        Returns:
-            Schedule description string.
-        """
+    @cached_property
+    def schedule_description(self) -> str:
+        """Human-readable schedule description, built once per scheduler."""
         mode = self.settings.backup_schedule_mode
         hour = self.settings.backup_schedule_hour
         minute = self.settings.backup_schedule_minute
         day_of_week = self.settings.backup_schedule_day_of_week
         interval_hours = self.settings.backup_schedule_interval_hours
 
-        day_names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-
         if mode == "interval":
             if interval_hours == 1:
                 return "Every hour"
@@ -121,7 +146,7 @@ class BackupScheduler:
             if day_of_week == "*":
                 return f"Daily at {hour:02d}:{minute:02d}"
             else:
-                days = [day_names[int(d.strip())] for d in day_of_week.split(",")]
+                days = [_DAY_NAMES[int(d)] for d in day_of_week.split(",")]
                 if len(days) == 1:
                     return f"Weekly on {days[0]} at {hour:02d}:{minute:02d}"
                 else:
@@ -152,11 +177,10 @@ class BackupScheduler:
         trigger = self._create_trigger()
 
         # Print scheduler info
-        schedule_desc = self._get_schedule_description()
-        print_scheduler_info(schedule_desc)
+        print_scheduler_info(self.schedule_description)
 
         # Use context manager for scheduler
-        with Scheduler() as scheduler:
+        with Scheduler(lease_duration=SCHEDULER_LEASE_DURATION) as scheduler:
             self.scheduler = scheduler
 
             # Import shutdown handler for coordination
@@ -5,20 +5,45 @@ Provides S3-compatible storage operations for backup upload and retention manage
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Callable, Optional
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 
 from config import Settings
 from ui.console import backup_logger
 
+# Concurrent per-repository requests when listing, sizing or deleting a backup
+REPO_REQUEST_WORKERS = 16
+
+# Largest object S3 accepts in a single PUT request
+MAX_SINGLE_PUT_SIZE = 5 * 1024 * 1024 * 1024
+
+# Maximum keys per DeleteObjects request (S3 API limit) and concurrent requests
+DELETE_BATCH_SIZE = 1000
+DELETE_WORKERS = 4
+
+# Upper bound for concurrent part transfers across all repositories backed
+# up in parallel. More connections mostly add contention and throttling.
+MAX_TOTAL_TRANSFER_CONCURRENCY = 32
+
+# Read/write size for managed transfers (boto3 default: 256 KiB). Larger reads
+# mean fewer syscalls for multi-GB bundles; downloads buffer up to 100 chunks.
+TRANSFER_IO_CHUNK_SIZE = 1024 * 1024
+
 
 class MultipartUploader:
-    """Handles multipart uploads with equal-sized chunks for S3 compatibility."""
+    """Uploads files with equal-sized multipart chunks for S3 compatibility.
+
+    Thin wrapper around the boto3 managed transfer, which splits files above
+    the threshold into chunks of the configured size (all equal except the
+    last one) and uploads them concurrently.
+    """
 
     def __init__(
         self,
@@ -26,6 +51,8 @@ class MultipartUploader:
         bucket: str,
         chunk_size: int,
         threshold: int,
+        transfer_config: Optional[TransferConfig] = None,
+        extra_args: Optional[dict] = None,
     ):
         """Initialize multipart uploader.
 
@@ -34,17 +61,37 @@ class MultipartUploader:
             bucket: Target bucket name.
             chunk_size: Size of each chunk in bytes (equal for all except last).
             threshold: File size threshold for multipart upload.
+            transfer_config: Optional transfer configuration providing the
+                concurrency and I/O settings; chunk size and threshold
+                always come from the arguments above.
+            extra_args: Optional extra upload parameters (e.g. StorageClass).
         """
         self.s3 = s3_client
         self.bucket = bucket
         self.chunk_size = chunk_size
         self.threshold = threshold
+        self.extra_args = extra_args or {}
+        # Files with fewer than two full chunks gain nothing from parallel
+        # parts but pay the extra multipart requests, so they are sent with a
+        # single PUT as well (within the 5 GiB single PUT limit)
+        self.single_put_limit = min(max(threshold, 2 * chunk_size), MAX_SINGLE_PUT_SIZE)
+
+        base_config = transfer_config or TransferConfig()
+        self.transfer_config = TransferConfig(
+            multipart_threshold=threshold,
+            multipart_chunksize=chunk_size,
+            max_concurrency=base_config.max_concurrency,
+            io_chunksize=base_config.io_chunksize,
+            use_threads=base_config.use_threads,
+        )
 
     def upload_file(self, local_path: Path, key: str) -> None:
         """Upload file using multipart upload if above threshold.
 
-        All chunks will be equal size except the last one, as required
-        by some S3-compatible servers.
+        Files smaller than twice the chunk size are always uploaded with a
+        single PUT. All chunks will be equal size except the last one, as
+        required by some S3-compatible servers. Failed multipart uploads
+        are aborted.
 
         Args:
             local_path: Path to the local file.
@@ -52,9 +99,10 @@ class MultipartUploader:
         """
         file_size = local_path.stat().st_size
 
-        if file_size < self.threshold:
-            # Use simple upload for small files
-            self.s3.upload_file(str(local_path), self.bucket, key)
+        if file_size < self.single_put_limit:
+            # Single PUT for small files, without setting up a transfer manager
+            with open(local_path, "rb") as f:
+                self.s3.put_object(Bucket=self.bucket, Key=key, Body=f, **self.extra_args)
             return
 
         backup_logger.debug(
@@ -62,65 +110,18 @@ class MultipartUploader:
             f"({file_size / (1024*1024):.1f} MB)"
         )
 
-        # Initialize multipart upload
-        response = self.s3.create_multipart_upload(Bucket=self.bucket, Key=key)
-        upload_id = response["UploadId"]
-
-        parts = []
-        part_number = 1
-
-        try:
-            with open(local_path, "rb") as f:
-                while True:
-                    chunk = f.read(self.chunk_size)
-                    if not chunk:
-                        break
-
-                    # Upload part
-                    part_response = self.s3.upload_part(
-                        Bucket=self.bucket,
-                        Key=key,
-                        PartNumber=part_number,
-                        UploadId=upload_id,
-                        Body=chunk,
-                    )
-
-                    parts.append({
-                        "PartNumber": part_number,
-                        "ETag": part_response["ETag"],
-                    })
-
-                    backup_logger.debug(
-                        f"Uploaded part {part_number} ({len(chunk) / (1024*1024):.1f} MB)"
-                    )
-                    part_number += 1
-
-            # Complete multipart upload
-            self.s3.complete_multipart_upload(
-                Bucket=self.bucket,
-                Key=key,
-                UploadId=upload_id,
-                MultipartUpload={"Parts": parts},
-            )
-
-            backup_logger.debug(
-                f"Completed multipart upload with {len(parts)} parts"
-            )
-
-        except Exception as e:
-            # Abort upload on failure
-            backup_logger.error(f"Multipart upload failed, aborting: {e}")
-            self.s3.abort_multipart_upload(
-                Bucket=self.bucket,
-                Key=key,
-                UploadId=upload_id,
-            )
-            raise
+        self.s3.upload_file(
+            str(local_path), self.bucket, key,
+            ExtraArgs=self.extra_args, Config=self.transfer_config,
+        )
 
 
 class S3Storage:
     """S3-compatible storage client for backup operations."""
 
+    # (endpoint, bucket) pairs already confirmed to exist in this process
+    _verified_buckets: set[tuple[Optional[str], str]] = set()
+
     def __init__(self, settings: Settings):
         """Initialize S3 storage client.
 
@@ -142,9 +143,15 @@ class S3Storage:
             self.prefix = self.owner
 
         # Configure boto3 for S3-compatible endpoints
+        # The connection pool must be at least as large as the number of
+        # parallel workers, otherwise threads queue for a free connection.
         boto_config = BotoConfig(
             signature_version="s3v4",
             s3={"addressing_style": "path"},  # Required for MinIO
+            max_pool_connections=settings.s3_max_pool_connections,
+            tcp_keepalive=True,
+            connect_timeout=10,
+            retries={"total_max_attempts": 5, "mode": "adaptive"},
         )
 
         self.s3 = boto3.client(
@@ -156,12 +163,36 @@ class S3Storage:
             config=boto_config,
         )
 
+        # Shared configuration for managed transfers (upload_file/download_file),
+        # so large downloads are fetched as parallel ranged requests. Each
+        # parallel repository backup transfers its own files, so the part
+        # concurrency per file is reduced to keep the total bounded.
+        max_concurrency = max(
+            1,
+            min(
+                settings.s3_max_concurrency,
+                MAX_TOTAL_TRANSFER_CONCURRENCY // settings.backup_parallelism,
+            ),
+        )
+        self.transfer_config = TransferConfig(
+            multipart_threshold=settings.s3_multipart_threshold,
+            multipart_chunksize=settings.s3_multipart_chunk_size,
+            max_concurrency=max_concurrency,
+            io_chunksize=TRANSFER_IO_CHUNK_SIZE,
+            use_threads=True,
+        )
+
+        # Extra parameters for backup objects (not the frequently rewritten state)
+        self.upload_args = {"StorageClass": settings.s3_storage_class} if settings.s3_storage_class else {}
+
         # Initialize multipart uploader for large files
         self.uploader = MultipartUploader(
             s3_client=self.s3,
             bucket=self.bucket,
             chunk_size=settings.s3_multipart_chunk_size,
             threshold=settings.s3_multipart_threshold,
+            transfer_config=self.transfer_config,
+            extra_args=self.upload_args,
         )
 
     def upload_file(self, local_path: Path, backup_id: str, repo_name: str) -> str:
@@ -180,7 +211,7 @@ class S3Storage:
         """
         key = f"{self.prefix}/{repo_name}/{backup_id}/{local_path.name}"
 
-        backup_logger.debug(f"Uploading {local_path.name} to s3://{self.bucket}/{key}")
+        backup_logger.debug("Uploading %s to s3://%s/%s", local_path.name, self.bucket, key)
 
         try:
             self.uploader.upload_file(local_path, key)
@@ -189,9 +220,82 @@ class S3Storage:
             backup_logger.error(f"Failed to upload {local_path}: {e}")
             raise
 
+    def upload_stream(self, stream: BinaryIO, filename: str, backup_id: str, repo_name: str) -> str:
+        """Upload a file-like stream to S3 without staging it on disk.
+
+        Non-seekable streams are uploaded in multipart chunks of the
+        configured chunk size, so up to chunk size times the transfer
+        concurrency is buffered in memory.
+
+        Args:
+            stream: Readable binary stream.
+            filename: Object file name (last key segment).
+            backup_id: Backup identifier (timestamp).
+            repo_name: Name of the repository.
+
+        Returns:
+            S3 key of the uploaded object.
+        """
+        key = f"{self.prefix}/{repo_name}/{backup_id}/{filename}"
+
+        backup_logger.debug("Streaming %s to s3://%s/%s", filename, self.bucket, key)
+
+        try:
+            self.s3.upload_fileobj(
+                stream, self.bucket, key,
+                ExtraArgs=self.upload_args, Config=self.transfer_config,
+            )
+            return key
+        except ClientError as e:
+            backup_logger.error(f"Failed to upload {filename}: {e}")
+            raise
+
+    def copy_file(
+        self,
+        filename: str,
+        source_backup_id: str,
+        backup_id: str,
+        repo_name: str,
+    ) -> Optional[int]:
+        """Copy a file from an earlier backup of a repository within S3.
+
+        The copy is done server-side (as multipart copy for large files),
+        so unchanged files do not have to be uploaded again.
+
+        Args:
+            filename: Object file name (last key segment).
+            source_backup_id: Backup identifier to copy from.
+            backup_id: Backup identifier to copy to.
+            repo_name: Name of the repository.
+
+        Returns:
+            Size of the copied file in bytes, or None if it could not be copied.
+        """
+        source_key = f"{self.prefix}/{repo_name}/{source_backup_id}/{filename}"
+        key = f"{self.prefix}/{repo_name}/{backup_id}/{filename}"
+
+        backup_logger.debug("Copying s3://%s/%s to %s", self.bucket, source_key, key)
+
+        try:
+            size = self.s3.head_object(Bucket=self.bucket, Key=source_key)["ContentLength"]
+            self.s3.copy(
+                {"Bucket": self.bucket, "Key": source_key},
+                self.bucket,
+                key,
+                ExtraArgs=self.upload_args,
+                Config=self.transfer_config,
+            )
+            return size
+        except ClientError as e:
+            backup_logger.debug(f"Failed to copy {source_key}: {e}")
+            return None
+
     def upload_directory(self, local_dir: Path, backup_id: str, repo_name: str) -> int:
         """Upload all files from a directory to S3.
 
+        Intended for small files such as metadata exports, which are sent
+        as single PUT requests without the managed transfer machinery.
+
         Args:
             local_dir: Path to the local directory.
             backup_id: Backup identifier (timestamp).
@@ -200,19 +304,43 @@ class S3Storage:
         Returns:
             Number of files uploaded.
         """
-        count = 0
-        for file_path in local_dir.rglob("*"):
-            if file_path.is_file():
-                relative_path = file_path.relative_to(local_dir)
-                key = f"{self.prefix}/{repo_name}/{backup_id}/{relative_path}"
+        files = []
+        key_prefix = f"{self.prefix}/{repo_name}/{backup_id}/"
+        base_len = len(str(local_dir)) + 1
+        # os.walk classifies entries from the directory listing itself,
+        # without an extra stat() per file like rglob() + is_file(), and
+        # keys are built from plain strings instead of Path objects
+        for root, _, names in os.walk(local_dir):
+            for name in names:
+                file_path = os.path.join(root, name)
+                relative_path = file_path[base_len:].replace(os.sep, "/")
+                files.append((file_path, key_prefix + relative_path))
+
+        if len(files) <= 1:
+            return sum(self._put_file(file_path, key) for file_path, key in files)
+
+        # Small files are dominated by request latency, so send them concurrently
+        workers = min(len(files), self.transfer_config.max_concurrency)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return sum(executor.map(lambda item: self._put_file(*item), files))
+
+    def _put_file(self, file_path: str, key: str) -> bool:
+        """Upload a small file with a single PUT request.
 
-                try:
-                    self.s3.upload_file(str(file_path), self.bucket, key)
-                    count += 1
-                except ClientError as e:
-                    backup_logger.warning(f"Failed to upload {file_path}: {e}")
+        Args:
+            file_path: Path to the local file.
+            key: S3 object key.
 
-        return count
+        Returns:
+            True if the upload succeeded, False otherwise.
+        """
+        try:
+            with open(file_path, "rb") as f:
+                self.s3.put_object(Bucket=self.bucket, Key=key, Body=f, **self.upload_args)
+            return True
+        except ClientError as e:
+            backup_logger.warning(f"Failed to upload {file_path}: {e}")
+            return False
 
     def list_repos(self) -> list[str]:
         """List all repository folders in the bucket.
@@ -221,7 +349,9 @@ class S3Storage:
             List of repository names.
         """
         try:
-            response = self.s3.list_objects_v2(
+            # A single response holds at most 1000 prefixes, so paginate
+            paginator = self.s3.get_paginator("list_objects_v2")
+            pages = paginator.paginate(
                 Bucket=self.bucket,
                 Prefix=f"{self.prefix}/",
                 Delimiter="/",
@@ -229,14 +359,15 @@ class S3Storage:
 
             prefix_parts_count = len(self.prefix.split("/"))
             repos = []
-            for prefix_obj in response.get("CommonPrefixes", []):
-                prefix = prefix_obj.get("Prefix", "")
-                parts = prefix.strip("/").split("/")
-                if len(parts) > prefix_parts_count:
-                    repo_name = parts[prefix_parts_count]
-                    # Skip state.json (it's at prefix level, not a repo)
-                    if repo_name != "state.json":
-                        repos.append(repo_name)
+            for page in pages:
+                for prefix_obj in page.get("CommonPrefixes", []):
+                    prefix = prefix_obj.get("Prefix", "")
+                    parts = prefix.strip("/").split("/")
+                    if len(parts) > prefix_parts_count:
+                        repo_name = parts[prefix_parts_count]
+                        # Skip state.json (it's at prefix level, not a repo)
+                        if repo_name != "state.json":
+                            repos.append(repo_name)
 
             return sorted(repos)
 
@@ -244,32 +375,22 @@ class S3Storage:
             backup_logger.error(f"Failed to list repos: {e}")
             return []
 
-    def list_backups(self) -> list[str]:
+    def list_backups(self, repos: Optional[list[str]] = None) -> list[str]:
         """List all backup IDs across all repositories.
 
         Scans all repos and collects unique backup IDs.
 
+        Args:
+            repos: Repository names to scan, from an earlier list_repos() call.
+                Listed if not provided.
+
         Returns:
             List of backup IDs (folder names) sorted newest first.
         """
         try:
-            repos = self.list_repos()
-            backup_ids: set[str] = set()
-
-            # Collect backup IDs from all repos
-            for repo in repos:
-                response = self.s3.list_objects_v2(
-                    Bucket=self.bucket,
-                    Prefix=f"{self.prefix}/{repo}/",
-                    Delimiter="/",
-                )
-
-                for prefix_obj in response.get("CommonPrefixes", []):
-                    prefix = prefix_obj.get("Prefix", "")
-                    parts = prefix.strip("/").split("/")
-                    # Backup ID is the last part: {prefix}/{repo}/{backup_id}/
-                    if parts:
-                        backup_ids.add(parts[-1])
+            if repos is None:
+                repos = self.list_repos()
+            backup_ids = set().union(*self._map_repos(self._list_repo_backup_ids, repos))
 
             # Sort by date (newest first)
             return sorted(backup_ids, reverse=True)
@@ -278,46 +399,168 @@ class S3Storage:
             backup_logger.error(f"Failed to list backups: {e}")
             return []
 
-    def delete_backup(self, backup_id: str) -> int:
-        """Delete a backup across all repositories.
+    def _list_repo_backup_ids(self, repo: str) -> list[str]:
+        """List the backup IDs of a single repository.
 
-        Removes the backup_id folder from each repo that has it.
+        Args:
+            repo: Repository name.
+
+        Returns:
+            Backup IDs (folder names) of the repository.
+        """
+        paginator = self.s3.get_paginator("list_objects_v2")
+        pages = paginator.paginate(
+            Bucket=self.bucket,
+            Prefix=f"{self.prefix}/{repo}/",
+            Delimiter="/",
+        )
+
+        backup_ids = []
+        for page in pages:
+            for prefix_obj in page.get("CommonPrefixes", []):
+                parts = prefix_obj.get("Prefix", "").strip("/").split("/")
+                # Backup ID is the last part: {prefix}/{repo}/{backup_id}/
+                if parts:
+                    backup_ids.append(parts[-1])
+        return backup_ids
+
+    def _map_repos(self, func: Callable, repos: list[str], *args) -> list:
+        """Run a per-repository request for all repositories concurrently.
 
         Args:
-            backup_id: Backup identifier to delete.
+            func: Callable taking a repository name and the extra arguments.
+            repos: Repository names.
+            *args: Extra arguments passed to every call.
 
         Returns:
-            Number of objects deleted.
+            Results in repository order. Exceptions are re-raised.
         """
-        repos = self.list_repos()
-        deleted_count = 0
+        if len(repos) <= 1:
+            return [func(repo, *args) for repo in repos]
+
+        with ThreadPoolExecutor(max_workers=min(len(repos), REPO_REQUEST_WORKERS)) as executor:
+            return list(executor.map(lambda repo: func(repo, *args), repos))
+
+    def list_objects(self, prefix: str) -> list[dict]:
+        """List all objects below a prefix.
+
+        Args:
+            prefix: Key prefix to list (should end with "/").
+
+        Returns:
+            List of object dicts as returned by ListObjectsV2, sorted by key.
+        """
+        return self._list_prefix(prefix)
+
+    def list_backup_objects(
+        self,
+        backup_id: str,
+        repo_name: Optional[str] = None,
+        repos: Optional[list[str]] = None,
+    ) -> list[dict]:
+        """List all objects of a backup.
+
+        Backups are stored per repository ({prefix}/{repo}/{backup_id}/{file}),
+        so only the backup folder of each repository is listed, concurrently,
+        instead of every retained backup below the owner prefix.
+
+        Args:
+            backup_id: Backup identifier.
+            repo_name: Only list the objects of this repository.
+            repos: Repository names to list, from an earlier list_repos()
+                call. Listed if not provided.
+
+        Returns:
+            List of object dicts as returned by ListObjectsV2, sorted by key.
+        """
+        if repo_name:
+            return self._list_repo_backup_objects(repo_name, backup_id)
+
+        if repos is None:
+            repos = self.list_repos()
+        objects = [
+            obj
+            for repo_objects in self._map_repos(self._list_repo_backup_objects, repos, backup_id)
+            for obj in repo_objects
+        ]
+        return sorted(objects, key=lambda obj: obj["Key"])
+
+    def _list_prefix(self, prefix: str) -> list[dict]:
+        """List all objects below a prefix using pagination.
+
+        Args:
+            prefix: Key prefix to list.
+
+        Returns:
+            List of object dicts as returned by ListObjectsV2.
+        """
+        objects = []
+        paginator = self.s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            objects.extend(page.get("Contents", []))
+        return objects
+
+    def get_backup_summaries(self) -> dict[str, tuple[int, int]]:
+        """Get size and repository count for every backup.
+
+        Uses a single paginated listing of the owner prefix instead of
+        listing each repository and backup separately.
+
+        Returns:
+            Dict mapping backup IDs to (total_size_bytes, repo_count).
+        """
+        sizes: dict[str, int] = {}
+        repos: dict[str, set[str]] = {}
 
         try:
-            for repo in repos:
-                prefix = f"{self.prefix}/{repo}/{backup_id}/"
+            for obj in self._list_prefix(f"{self.prefix}/"):
+                # Key structure: {prefix}/{repo}/{backup_id}/{file}
+                parts = obj["Key"][len(self.prefix) + 1:].split("/", 2)
+                if len(parts) < 3:
+                    continue  # e.g. state.json
+
+                repo_name, backup_id = parts[0], parts[1]
+                sizes[backup_id] = sizes.get(backup_id, 0) + obj.get("Size", 0)
+                repos.setdefault(backup_id, set()).add(repo_name)
+
+        except ClientError as e:
+            backup_logger.error(f"Failed to list backups: {e}")
+            return {}
 
-                # List all objects with this prefix
-                paginator = self.s3.get_paginator("list_objects_v2")
-                pages = paginator.paginate(Bucket=self.bucket, Prefix=prefix)
+        return {backup_id: (sizes[backup_id], len(repos[backup_id])) for backup_id in sizes}
 
-                for page in pages:
-                    objects = page.get("Contents", [])
-                    if not objects:
-                        continue
+    def delete_backup(self, backup_id: str, repos: Optional[list[str]] = None) -> int:
+        """Delete a backup across all repositories.
 
-                    # Delete objects in batches of 1000
-                    delete_keys = [{"Key": obj["Key"]} for obj in objects]
+        Removes the backup_id folder from each repo that has it.
 
-                    response = self.s3.delete_objects(
-                        Bucket=self.bucket,
-                        Delete={"Objects": delete_keys, "Quiet": True},
-                    )
+        Args:
+            backup_id: Backup identifier to delete.
+            repos: Repository names to delete the backup from, from an
+                earlier list_repos() call. Listed if not provided.
 
-                    deleted_count += len(delete_keys)
-                    errors = response.get("Errors", [])
-                    if errors:
-                        for error in errors:
-                            backup_logger.warning(f"Failed to delete {error['Key']}: {error['Message']}")
+        Returns:
+            Number of objects deleted.
+        """
+        if repos is None:
+            repos = self.list_repos()
+
+        try:
+            # Collect the keys of all repositories first, then delete them in
+            # batches of up to 1000 keys regardless of the repository
+            keys = [
+                obj["Key"]
+                for repo_objects in self._map_repos(self._list_repo_backup_objects, repos, backup_id)
+                for obj in repo_objects
+            ]
+            batches = [
+                keys[i:i + DELETE_BATCH_SIZE] for i in range(0, len(keys), DELETE_BATCH_SIZE)
+            ]
+            if len(batches) <= 1:
+                deleted_count = sum(map(self._delete_keys, batches))
+            else:
+                with ThreadPoolExecutor(max_workers=min(len(batches), DELETE_WORKERS)) as executor:
+                    deleted_count = sum(executor.map(self._delete_keys, batches))
 
             backup_logger.info(f"Deleted backup {backup_id} ({deleted_count} objects)")
             return deleted_count
@@ -326,6 +569,37 @@ class S3Storage:
             backup_logger.error(f"Failed to delete backup {backup_id}: {e}")
             return 0
 
+    def _list_repo_backup_objects(self, repo: str, backup_id: str) -> list[dict]:
+        """List the objects of a backup in a single repository.
+
+        Args:
+            repo: Repository name.
+            backup_id: Backup identifier.
+
+        Returns:
+            Object dicts below the backup folder of the repository.
+        """
+        return self._list_prefix(f"{self.prefix}/{repo}/{backup_id}/")
+
+    def _delete_keys(self, keys: list[str]) -> int:
+        """Delete up to 1000 objects with a single request.
+
+        Args:
+            keys: Object keys to delete.
+
+        Returns:
+            Number of objects deleted.
+        """
+        response = self.s3.delete_objects(
+            Bucket=self.bucket,
+            Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+        )
+
+        errors = response.get("Errors", [])
+        for error in errors:
+            backup_logger.warning(f"Failed to delete {error['Key']}: {error['Message']}")
+        return len(keys)
+
     def cleanup_old_backups(
         self,
         repo_last_backups: Optional[dict[str, str]] = None,
@@ -343,7 +617,9 @@ class S3Storage:
         Returns:
             Number of backups deleted.
         """
-        backups = self.list_backups()
+        # List the repositories once for the whole cleanup
+        repos = self.list_repos()
+        backups = self.list_backups(repos)
         deleted_count = 0
 
         if len(backups) <= self.retention:
@@ -372,7 +648,7 @@ class S3Storage:
             backup_logger.info(f"Cleaning up {len(to_delete)} old backup(s)")
 
             for backup_id in to_delete:
-                self.delete_backup(backup_id)
+                self.delete_backup(backup_id, repos)
                 deleted_count += 1
 
         return deleted_count
@@ -380,11 +656,19 @@ class S3Storage:
     def ensure_bucket_exists(self) -> bool:
         """Ensure the target bucket exists.
 
+        The result is remembered for the lifetime of the process, so
+        scheduled runs only check the bucket once.
+
         Returns:
             True if bucket exists or was created.
         """
+        bucket_id = (self.settings.s3_endpoint_url, self.bucket)
+        if bucket_id in self._verified_buckets:
+            return True
+
         try:
             self.s3.head_bucket(Bucket=self.bucket)
+            self._verified_buckets.add(bucket_id)
             return True
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "")
@@ -392,6 +676,7 @@ class S3Storage:
                 backup_logger.info(f"Bucket {self.bucket} does not exist, creating...")
                 try:
                     self.s3.create_bucket(Bucket=self.bucket)
+                    self._verified_buckets.add(bucket_id)
                     return True
                 except ClientError as create_error:
                     backup_logger.error(f"Failed to create bucket: {create_error}")
@@ -400,30 +685,43 @@ class S3Storage:
                 backup_logger.error(f"Error checking bucket: {e}")
                 return False
 
-    def get_backup_size(self, backup_id: str) -> int:
+    def get_backup_size(self, backup_id: str, repos: Optional[list[str]] = None) -> int:
         """Get total size of a backup in bytes.
 
         Sums sizes across all repos for the given backup_id.
 
         Args:
             backup_id: Backup identifier.
+            repos: Repository names to include, from an earlier list_repos()
+                call. Listed if not provided.
 
         Returns:
             Total size in bytes.
         """
-        repos = self.list_repos()
-        total_size = 0
+        if repos is None:
+            repos = self.list_repos()
 
         try:
-            paginator = self.s3.get_paginator("list_objects_v2")
-            for repo in repos:
-                prefix = f"{self.prefix}/{repo}/{backup_id}/"
-                for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
-                    for obj in page.get("Contents", []):
-                        total_size += obj.get("Size", 0)
+            return sum(self._map_repos(self._get_repo_backup_size, repos, backup_id))
         except ClientError:
-            pass
+            return 0
+
+    def _get_repo_backup_size(self, repo: str, backup_id: str) -> int:
+        """Get the size of a backup in a single repository in bytes.
 
+        Args:
+            repo: Repository name.
+            backup_id: Backup identifier.
+
+        Returns:
+            Size in bytes.
+        """
+        total_size = 0
+        paginator = self.s3.get_paginator("list_objects_v2")
+        prefix = f"{self.prefix}/{repo}/{backup_id}/"
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                total_size += obj.get("Size", 0)
         return total_size
 
     # === State File Operations ===
@@ -451,7 +749,7 @@ class S3Storage:
         key = self.get_state_key()
 
         try:
-            self.s3.upload_file(str(local_path), self.bucket, key)
+            self.s3.upload_file(str(local_path), self.bucket, key, Config=self.transfer_config)
             backup_logger.debug(f"Uploaded state to s3://{self.bucket}/{key}")
             return True
         except ClientError as e:
@@ -473,12 +771,11 @@ class S3Storage:
             # Ensure parent directory exists
             local_path.parent.mkdir(parents=True, exist_ok=True)
 
-            self.s3.download_file(self.bucket, key, str(local_path))
+            self.s3.download_file(self.bucket, key, str(local_path), Config=self.transfer_config)
             backup_logger.info(f"Downloaded state from s3://{self.bucket}/{key}")
             return True
         except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "")
-            if error_code == "404" or error_code == "NoSuchKey":
+            if is_not_found(e):
                 backup_logger.debug(f"No state file found in S3 (first run)")
                 return False
             backup_logger.error(f"Failed to download state from S3: {e}")
@@ -487,16 +784,24 @@ class S3Storage:
     def state_exists(self) -> bool:
         """Check if state file exists in S3.
 
+        Only a "not found" response counts as missing. Other errors (after
+        the client's retries) are logged and treated as existing, so local
+        state is never discarded because S3 was briefly unavailable.
+
         Returns:
-            True if state file exists, False otherwise.
+            True if state file exists or its existence is unknown, False
+            if S3 reports it as missing.
         """
         key = self.get_state_key()
 
         try:
             self.s3.head_object(Bucket=self.bucket, Key=key)
             return True
-        except ClientError:
-            return False
+        except ClientError as e:
+            if is_not_found(e):
+                return False
+            backup_logger.warning(f"Could not check state in S3: {e}")
+            return True
 
     def get_state_last_modified(self) -> Optional[datetime]:
         """Get last modified time of state file in S3.
@@ -509,5 +814,12 @@ class S3Storage:
         try:
             response = self.s3.head_object(Bucket=self.bucket, Key=key)
             return response.get("LastModified")
-        except ClientError:
+        except ClientError as e:
+            if not is_not_found(e):
+                backup_logger.warning(f"Could not check state in S3: {e}")
             return None
+
+
+def is_not_found(error: ClientError) -> bool:
+    """Check if an S3 error means the requested object does not exist."""
+    return error.response.get("Error", {}).get("Code", "") in ("404", "NoSuchKey", "NotFound")
@@ -8,10 +8,14 @@ State is stored locally and synced to S3 to survive container restarts
 and data volume loss.
 """
 
-import json
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
+from typing import Iterator, Optional, TYPE_CHECKING
+
+from pydantic_core import from_json, to_json
 
 from ui.console import backup_logger
 
@@ -19,24 +23,21 @@ if TYPE_CHECKING:
     from storage.s3_client import S3Storage
 
 
+@dataclass(slots=True)
 class RepoState:
     """State information for a single repository."""
 
-    def __init__(
-        self,
-        pushed_at: Optional[str] = None,
-        last_backup: Optional[str] = None,
-        last_backup_id: Optional[str] = None,
-    ):
-        self.pushed_at = pushed_at
-        self.last_backup = last_backup
-        self.last_backup_id = last_backup_id
+    pushed_at: Optional[str] = None
+    last_backup: Optional[str] = None
+    last_backup_id: Optional[str] = None
+    refs_digest: Optional[str] = None
 
     def to_dict(self) -> dict:
         return {
             "pushed_at": self.pushed_at,
             "last_backup": self.last_backup,
             "last_backup_id": self.last_backup_id,
+            "refs_digest": self.refs_digest,
         }
 
     @classmethod
@@ -45,6 +46,7 @@ class RepoState:
             pushed_at=data.get("pushed_at"),
             last_backup=data.get("last_backup"),
             last_backup_id=data.get("last_backup_id"),
+            refs_digest=data.get("refs_digest"),
         )
 
 
@@ -72,6 +74,9 @@ class SyncStateManager:
         self.s3_storage = s3_storage
         self._ensure_data_dir()
         self._state: Optional[dict] = None
+        self._state_mtime: Optional[int] = None
+        self._dirty = False
+        self._batch_depth = 0
 
         # Restore state from S3 on startup if local state is missing
         self._restore_state_from_s3()
@@ -130,41 +135,68 @@ class SyncStateManager:
         # Try to restore state now that we have S3
         self._restore_state_from_s3()
 
+    def _get_state_mtime(self) -> Optional[int]:
+        """Get the modification time of the state file, or None if it is missing."""
+        try:
+            return self.state_file.stat().st_mtime_ns
+        except OSError:
+            return None
+
     def _load_state(self) -> dict:
-        """Load state from file."""
-        if self._state is not None:
+        """Load state from file.
+
+        The parsed state is cached and only read again if the file was
+        changed by another SyncStateManager (e.g. the one used by a backup
+        run) and there are no unsaved changes.
+        """
+        state_mtime = self._get_state_mtime()
+        if self._state is not None and (self._dirty or state_mtime == self._state_mtime):
             return self._state
 
-        if not self.state_file.exists():
+        self._state_mtime = state_mtime
+        if state_mtime is None:
             self._state = {"repositories": {}}
             return self._state
 
         try:
-            with open(self.state_file, "r") as f:
-                self._state = json.load(f)
+            with open(self.state_file, "rb") as f:
+                self._state = from_json(f.read())
                 # Ensure repositories dict exists (backward compatibility)
                 if "repositories" not in self._state:
                     self._state["repositories"] = {}
                 return self._state
-        except (json.JSONDecodeError, ValueError) as e:
+        except ValueError as e:
             backup_logger.warning(f"Failed to read sync state: {e}")
             self._state = {"repositories": {}}
             return self._state
 
     def _save_state(self) -> None:
-        """Save state to file and sync to S3."""
+        """Save state to file and sync to S3.
+
+        The state is written to a temporary file that replaces the state
+        file atomically, so an unclean shutdown never leaves a truncated
+        state file behind.
+        """
         if self._state is None:
             return
 
         self._state["updated_at"] = datetime.now().isoformat()
 
+        tmp_file = self.state_file.with_name(f"{self.STATE_FILE}.tmp")
         try:
-            with open(self.state_file, "w") as f:
-                json.dump(self._state, f, indent=2)
+            with open(tmp_file, "wb") as f:
+                f.write(to_json(self._state, indent=2))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.state_file)
+            # Pending changes stay dirty if the write failed, so flush() retries them
+            self._dirty = False
+            self._state_mtime = self._get_state_mtime()
             # Sync to S3 for persistence
             self._sync_state_to_s3()
         except IOError as e:
             backup_logger.error(f"Failed to write sync state: {e}")
+            tmp_file.unlink(missing_ok=True)
 
     def get_last_sync_time(self) -> Optional[datetime]:
         """Get the timestamp of the last successful backup.
@@ -192,7 +224,8 @@ class SyncStateManager:
 
         state = self._load_state()
         state["last_sync"] = sync_time.isoformat()
-        self._save_state()
+        self._dirty = True
+        self.flush()
         backup_logger.debug(f"Updated sync state: {sync_time.isoformat()}")
 
     # === Repository State Methods ===
@@ -217,6 +250,7 @@ class SyncStateManager:
         repo_name: str,
         pushed_at: str,
         backup_id: str,
+        refs_digest: Optional[str] = None,
     ) -> None:
         """Update state for a repository after successful backup.
 
@@ -224,15 +258,81 @@ class SyncStateManager:
             repo_name: Repository name.
             pushed_at: GitHub pushed_at timestamp.
             backup_id: Backup identifier where this repo was backed up.
+            refs_digest: Digest of the refs contained in the git bundle.
+        """
+        self.update_repo_state_in_memory(repo_name, pushed_at, backup_id, refs_digest)
+        self.flush()
+
+    def update_repo_state_in_memory(
+        self,
+        repo_name: str,
+        pushed_at: str,
+        backup_id: str,
+        refs_digest: Optional[str] = None,
+    ) -> None:
+        """Update state for a repository without saving it.
+
+        Use flush() to save all pending updates with a single write and
+        S3 upload.
+
+        Args:
+            repo_name: Repository name.
+            pushed_at: GitHub pushed_at timestamp.
+            backup_id: Backup identifier where this repo was backed up.
+            refs_digest: Digest of the refs contained in the git bundle.
         """
         state = self._load_state()
         state["repositories"][repo_name] = {
             "pushed_at": pushed_at,
             "last_backup": datetime.now().isoformat(),
             "last_backup_id": backup_id,
+            "refs_digest": refs_digest,
         }
+        self._dirty = True
+        backup_logger.debug("Updated repo state: %s -> %s", repo_name, backup_id)
+
+    def flush(self) -> None:
+        """Save pending state updates to file and S3.
+
+        Inside batch_update() saving is deferred until the batch ends.
+        """
+        if not self._dirty or self._batch_depth:
+            return
         self._save_state()
-        backup_logger.debug(f"Updated repo state: {repo_name} -> {backup_id}")
+
+    @contextmanager
+    def batch_update(self) -> Iterator[None]:
+        """Defer all state saves until the end of the block.
+
+        Collects every update made inside the block (including those of
+        update_sync_time() and remove_repo_state()) into a single file
+        write and S3 upload. Pending updates are also saved if the block
+        raises.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            self.flush()
+
+    def increment_backups_since_cleanup(self) -> int:
+        """Count a backup run that wrote new backups, without saving it.
+
+        Returns:
+            Number of such runs since the last retention cleanup.
+        """
+        state = self._load_state()
+        count = state.get("backups_since_cleanup", 0) + 1
+        state["backups_since_cleanup"] = count
+        self._dirty = True
+        return count
+
+    def reset_backups_since_cleanup(self) -> None:
+        """Reset the backup run counter after a retention cleanup, without saving it."""
+        state = self._load_state()
+        state["backups_since_cleanup"] = 0
+        self._dirty = True
 
     def has_repo_changed(self, repo_name: str, current_pushed_at: str) -> bool:
         """Check if a repository has changed since last backup.
@@ -263,6 +363,23 @@ class SyncStateManager:
         backup_logger.debug(f"{repo_name}: Unchanged since {repo_state.last_backup}")
         return False
 
+    def get_all_states(self) -> dict[str, str]:
+        """Get the last backed up pushed_at timestamp of all repositories.
+
+        Allows checking many repositories for changes with a single state
+        lookup instead of calling has_repo_changed() per repository.
+
+        Returns:
+            Dict mapping repo names to their pushed_at timestamps. Repos
+            without a recorded pushed_at are omitted.
+        """
+        state = self._load_state()
+        return {
+            name: data["pushed_at"]
+            for name, data in state["repositories"].items()
+            if data.get("pushed_at")
+        }
+
     def get_last_backup_id(self, repo_name: str) -> Optional[str]:
         """Get the last backup ID for a repository.
 
@@ -299,7 +416,8 @@ class SyncStateManager:
         state = self._load_state()
         if repo_name in state["repositories"]:
             del state["repositories"][repo_name]
-            self._save_state()
+            self._dirty = True
+            self.flush()
             backup_logger.debug(f"Removed repo state: {repo_name}")
 
     def should_run_backup(self, schedule_hour: int, schedule_minute: int) -> bool:
@@ -0,0 +1,100 @@
+"""
+GitHub Backup - CLI Tests
+
+Tests for CLI helpers that read backups from S3, using moto for S3 emulation.
+"""
+
+from pathlib import Path
+from typing import Generator
+from unittest.mock import patch
+
+import pytest
+from moto import mock_aws
+
+from cli import _artifact_key, _list_artifact_keys, _list_repos_in_backup, _restore_to_remote
+from config import Settings
+from storage.s3_client import S3Storage
+
+
+class TestRestoreListing:
+    """Tests for resolving the repositories of a backup for restore."""
+
+    @mock_aws
+    def test_list_repos_in_backup_from_uploads(self, test_settings: Settings, temp_dir: Path):
+        """Test that repositories uploaded by a backup run are found for restore local-all."""
+        storage = S3Storage(test_settings)
+        storage.s3.create_bucket(Bucket=test_settings.s3_bucket)
+
+        backup_id = "2024-01-15_02-00-00"
+        files = {
+            "repo1": ["repo1.bundle", "repo1.lfs.tar.gz", "repo1.wiki.bundle"],
+            "repo2": ["repo2.bundle"],
+        }
+        for repo, names in files.items():
+            for name in names:
+                path = temp_dir / name
+                path.write_bytes(b"content")
+                storage.upload_file(path, backup_id, repo)
+
+        metadata_dir = temp_dir / "metadata"
+        metadata_dir.mkdir()
+        (metadata_dir / "issues.json").write_text("[]")
+        storage.upload_directory(metadata_dir, backup_id, "repo2")
+
+        # Another backup of the same repository must not be included
+        storage.upload_file(temp_dir / "repo1.bundle", "2024-01-14_02-00-00", "repo3")
+
+        repos = _list_repos_in_backup(storage, backup_id)
+
+        assert repos == [
+            {"name": "repo1", "has_bundle": True, "has_lfs": True, "has_wiki": True, "has_metadata": False},
+            {"name": "repo2", "has_bundle": True, "has_lfs": False, "has_wiki": False, "has_metadata": True},
+        ]
+        assert _list_artifact_keys(storage, backup_id, "repo1") == {
+            _artifact_key(storage, backup_id, "repo1", suffix)
+            for suffix in (".bundle", ".lfs.tar.gz", ".wiki.bundle")
+        }
+
+
+class TestRestoreToRemote:
+    """Tests for the cleanup of downloaded artifacts when restoring to a remote."""
+
+    @pytest.fixture
+    def storage(self, test_settings: Settings, temp_dir: Path) -> Generator[S3Storage, None, None]:
+        """Create a backup holding only the LFS archive and wiki bundle of a repository."""
+        with mock_aws():
+            storage = S3Storage(test_settings)
+            storage.s3.create_bucket(Bucket=test_settings.s3_bucket)
+
+            upload_dir = temp_dir / "upload"
+            upload_dir.mkdir()
+            for name in ["repo.lfs.tar.gz", "repo.wiki.bundle"]:
+                path = upload_dir / name
+                path.write_bytes(b"content")
+                storage.upload_file(path, "2024-01-15_02-00-00", "repo")
+            yield storage
+
+    def test_downloads_removed_when_bundle_missing(
+        self, test_settings: Settings, temp_dir: Path, storage: S3Storage
+    ):
+        """Test that downloaded artifacts are removed if there is no bundle to restore."""
+        result = _restore_to_remote(
+            storage, "2024-01-15_02-00-00", "repo", test_settings,
+            "https://example.com/repo.git", False, temp_dir / "clone", include_wiki=True,
+        )
+
+        assert result == (None, None, None)
+        assert list((temp_dir / "temp").iterdir()) == []
+
+    def test_downloads_removed_when_clone_fails(
+        self, test_settings: Settings, temp_dir: Path, storage: S3Storage
+    ):
+        """Test that downloaded artifacts are removed if the restore raises."""
+        with patch("cli._clone_bare_from_s3", side_effect=RuntimeError("clone failed")):
+            with pytest.raises(RuntimeError):
+                _restore_to_remote(
+                    storage, "2024-01-15_02-00-00", "repo", test_settings,
+                    "https://example.com/repo.git", False, temp_dir / "clone", include_wiki=True,
+                )
+
+        assert list((temp_dir / "temp").iterdir()) == []
@@ -4,10 +4,12 @@ GitHub Backup - Configuration Tests
 Tests for configuration validation and parsing.
 """
 
+import os
+
 import pytest
 from pydantic import ValidationError
 
-from config import Settings
+from config import Settings, get_fresh_settings, get_settings
 
 
 class TestSettings:
@@ -46,14 +48,21 @@ class TestSettings:
         assert settings.github_backup_forks is False
         assert settings.github_backup_archived is True
         assert settings.backup_retention_count == 7
+        assert settings.backup_cleanup_interval == 1
         assert settings.backup_include_metadata is True
         assert settings.backup_include_wiki is True
         assert settings.backup_incremental is True
+        assert settings.backup_parallelism == 4
+        assert settings.backup_stream_bundles is False
+        assert settings.backup_mirror_cache is False
         assert settings.backup_schedule_enabled is True
         assert settings.backup_schedule_mode == "cron"
         assert settings.backup_schedule_hour == 2
         assert settings.backup_schedule_minute == 0
         assert settings.s3_region == "us-east-1"
+        assert settings.s3_storage_class == ""
+        assert settings.s3_max_pool_connections == 64
+        assert settings.s3_max_concurrency == 10
         assert settings.alert_enabled is False
         assert settings.alert_level == "errors"
         assert settings.log_level == "INFO"
@@ -72,6 +81,7 @@ class TestSettings:
         )
 
         assert settings.get_alert_channels() == ["email", "webhook", "teams"]
+        assert settings.alert_channels_list == ("email", "webhook", "teams")
 
     def test_alert_channels_validation_invalid(self, temp_dir):
         """Test that invalid alert channels are rejected."""
@@ -121,6 +131,19 @@ class TestSettings:
         )
         assert settings.backup_schedule_day_of_week == "0,2,4"
 
+        # Unordered days with whitespace are normalized
+        settings = Settings(
+            github_owner="test",
+            github_pat="test",
+            s3_endpoint_url="http://test",
+            s3_bucket="test",
+            s3_access_key="test",
+            s3_secret_key="test",
+            backup_schedule_day_of_week="4, 0,2",
+            data_dir=str(temp_dir),
+        )
+        assert settings.backup_schedule_day_of_week == "0,2,4"
+
     def test_day_of_week_validation_invalid(self, temp_dir):
         """Test that invalid day of week is rejected."""
         with pytest.raises(ValidationError):
@@ -164,6 +187,7 @@ class TestSettings:
 
         recipients = settings.get_smtp_recipients()
         assert recipients == ["admin@test.com", "user@test.com", "another@test.com"]
+        assert settings.smtp_recipients_list == ("admin@test.com", "user@test.com", "another@test.com")
 
     def test_get_smtp_recipients_empty(self, temp_dir):
         """Test empty SMTP recipients."""
@@ -222,3 +246,45 @@ class TestSettings:
                 data_dir=str(temp_dir),
             )
             assert settings.backup_schedule_mode == mode
+
+    def test_get_settings_is_cached(self, temp_dir, monkeypatch):
+        """Test that get_settings loads settings once and reuses them."""
+        monkeypatch.setenv("GITHUB_OWNER", "cached-org")
+        monkeypatch.setenv("S3_BUCKET", "test")
+        monkeypatch.setenv("S3_ACCESS_KEY", "test")
+        monkeypatch.setenv("S3_SECRET_KEY", "test")
+        monkeypatch.setenv("DATA_DIR", str(temp_dir))
+
+        get_settings.cache_clear()
+        try:
+            settings = get_settings()
+            assert settings.github_owner == "cached-org"
+            assert get_settings() is settings
+        finally:
+            get_settings.cache_clear()
+
+    def test_get_fresh_settings_reloads_on_env_change(self, temp_dir, monkeypatch):
+        """Test that get_fresh_settings only reloads when .env changes."""
+        monkeypatch.chdir(temp_dir)
+        monkeypatch.delenv("GITHUB_OWNER", raising=False)
+        monkeypatch.setenv("S3_BUCKET", "test")
+        monkeypatch.setenv("S3_ACCESS_KEY", "test")
+        monkeypatch.setenv("S3_SECRET_KEY", "test")
+        monkeypatch.setenv("DATA_DIR", str(temp_dir))
+        env_file = temp_dir / ".env"
+        env_file.write_text("GITHUB_OWNER=first-org\n")
+
+        get_settings.cache_clear()
+        try:
+            settings = get_fresh_settings()
+            assert settings.github_owner == "first-org"
+            assert get_fresh_settings() is settings
+
+            env_file.write_text("GITHUB_OWNER=second-org\n")
+            os.utime(env_file, (env_file.stat().st_atime, env_file.stat().st_mtime + 10))
+
+            reloaded = get_fresh_settings()
+            assert reloaded is not settings
+            assert reloaded.github_owner == "second-org"
+        finally:
+            get_settings.cache_clear()
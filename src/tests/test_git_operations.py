@@ -0,0 +1,86 @@
+"""
+GitHub Backup - Git Operations Tests
+
+Tests for bundle creation using a local source repository.
+"""
+
+import io
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from backup.git_operations import GitBackup
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+@pytest.fixture
+def source_repo(temp_dir: Path) -> Path:
+    """Create a local repository with a single commit."""
+    repo = temp_dir / "source"
+    subprocess.run(["git", "init", "-q", str(repo)], check=True)
+    (repo / "README.md").write_text("test\n")
+    subprocess.run(["git", "add", "README.md"], cwd=repo, check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", "commit", "-q", "-m", "Initial"],
+        cwd=repo,
+        check=True,
+    )
+    return repo
+
+
+class TestGitBackup:
+    """Tests for GitBackup class."""
+
+    def test_reuse_bundle_skips_bundle_creation(self, temp_dir: Path, source_repo: Path):
+        """Test that a reused bundle is not created again."""
+        git_backup = GitBackup(temp_dir / "work")
+        digests = []
+
+        def reuse_bundle(refs_digest: str) -> int:
+            digests.append(refs_digest)
+            return 1234
+
+        result = git_backup.clone_and_bundle(str(source_repo), "repo", reuse_bundle=reuse_bundle)
+
+        assert result.bundle_reused is True
+        assert result.bundle_size == 1234
+        assert result.bundle_path is None
+        assert digests == [result.refs_digest]
+        assert not (temp_dir / "work" / "repo.bundle").exists()
+
+    def test_bundle_created_when_refs_changed(self, temp_dir: Path, source_repo: Path):
+        """Test that a new bundle is created if the previous one cannot be reused."""
+        git_backup = GitBackup(temp_dir / "work")
+
+        result = git_backup.clone_and_bundle(str(source_repo), "repo", reuse_bundle=lambda digest: None)
+
+        assert result.bundle_reused is False
+        assert result.refs_digest is not None
+        assert result.bundle_path == temp_dir / "work" / "repo.bundle"
+        assert result.bundle_size == result.bundle_path.stat().st_size > 0
+
+    def test_stream_bundle(self, temp_dir: Path, source_repo: Path):
+        """Test that a streamed bundle matches a bundle written to disk."""
+        git_backup = GitBackup(temp_dir / "work")
+        mirror_path = git_backup.mirror_clone(str(source_repo), "repo")
+        bundle_path = git_backup.create_bundle(mirror_path)
+        sink = io.BytesIO()
+
+        size = git_backup.stream_bundle(mirror_path, lambda stream: sink.write(stream.read()))
+
+        assert size == bundle_path.stat().st_size
+        assert sink.getvalue() == bundle_path.read_bytes()
+
+    def test_stream_bundle_failure_raises(self, temp_dir: Path):
+        """Test that a failing git bundle raises with its error output."""
+        git_backup = GitBackup(temp_dir / "work")
+        not_a_repo = temp_dir / "empty"
+        not_a_repo.mkdir()
+
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            git_backup.stream_bundle(not_a_repo, lambda stream: stream.read())
+
+        assert exc_info.value.stderr
@@ -0,0 +1,214 @@
+"""
+GitHub Backup - Backup Run Tests
+
+Tests for the parallel repository backup in run_backup, using fake GitHub,
+git and S3 clients.
+"""
+
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Optional
+
+import pytest
+
+import main
+from backup.git_operations import BackupResult
+from config import Settings
+from sync_state_manager import SyncStateManager
+
+REPO_NAMES = [f"repo{i}" for i in range(10)] + ["clone-fails", "upload-fails"]
+
+
+class FakeGitHubClient:
+    """GitHub client returning a fixed list of repositories."""
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+    def get_repositories(self) -> list[SimpleNamespace]:
+        return [
+            SimpleNamespace(name=name, pushed_at=f"{name}-pushed", repo=None, has_wiki=False)
+            for name in REPO_NAMES
+        ]
+
+    def get_clone_url(self, repo_info: SimpleNamespace) -> str:
+        return f"https://github.com/test-org/{repo_info.name}.git"
+
+
+class FakeS3Storage:
+    """S3 storage recording uploads, with slow uploads and one failing repository."""
+
+    def __init__(self, tracker: "InFlightTracker"):
+        self.tracker = tracker
+        self.uploaded: list[str] = []
+        self.cleanup_calls = 0
+
+    def ensure_bucket_exists(self) -> bool:
+        return True
+
+    def upload_file(self, local_path: Path, backup_id: str, repo_name: str) -> str:
+        try:
+            time.sleep(0.02)
+            if repo_name == "upload-fails":
+                raise RuntimeError("upload failed")
+            self.uploaded.append(repo_name)
+            return f"test-org/{repo_name}/{backup_id}/{local_path.name}"
+        finally:
+            self.tracker.finish()
+
+    def cleanup_old_backups(self, repo_last_backups: Optional[dict] = None) -> int:
+        self.cleanup_calls += 1
+        return 0
+
+    def download_state(self, local_path: Path) -> bool:
+        return False
+
+    def state_exists(self) -> bool:
+        return True
+
+    def upload_state(self, local_path: Path) -> bool:
+        return True
+
+
+class InFlightTracker:
+    """Counts repositories between the start of their clone and the end of their upload."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.current = 0
+        self.maximum = 0
+
+    def start(self) -> None:
+        with self.lock:
+            self.current += 1
+            self.maximum = max(self.maximum, self.current)
+
+    def finish(self) -> None:
+        with self.lock:
+            self.current -= 1
+
+
+def make_git_backup(tracker: InFlightTracker, on_clone=None):
+    """Create a fake GitBackup class writing small bundles to the work directory."""
+
+    class FakeGitBackup:
+        def __init__(self, work_dir: Path, mirror_cache_dir: Optional[Path] = None):
+            self.work_dir = work_dir
+
+        def clone_and_bundle(self, repo_url, repo_name, bundle_sink=None, reuse_bundle=None):
+            tracker.start()
+            if on_clone:
+                on_clone(repo_name)
+            if repo_name == "clone-fails":
+                tracker.finish()
+                raise RuntimeError("clone failed")
+
+            bundle_path = self.work_dir / f"{repo_name}.bundle"
+            bundle_path.write_bytes(b"x" * 10)
+            result = BackupResult()
+            result.bundle_path = bundle_path
+            result.bundle_size = 10
+            return result
+
+    return FakeGitBackup
+
+
+@pytest.fixture
+def backup_settings(test_settings: Settings) -> Settings:
+    """Settings for a run that only backs up git bundles."""
+    test_settings.backup_include_metadata = False
+    test_settings.backup_include_wiki = False
+    test_settings.backup_parallelism = 2
+    return test_settings
+
+
+@pytest.fixture
+def fake_run(monkeypatch: pytest.MonkeyPatch, backup_settings: Settings):
+    """Patch run_backup's collaborators and capture the reported statistics."""
+    tracker = InFlightTracker()
+    s3_storage = FakeS3Storage(tracker)
+    summaries: list[dict] = []
+
+    monkeypatch.setattr(main, "shutdown_handler", main.ShutdownHandler())
+    monkeypatch.setattr(main, "print_summary", lambda stats, duration: summaries.append(stats))
+    monkeypatch.setattr("backup.github_client.GitHubBackupClient", FakeGitHubClient)
+    monkeypatch.setattr("backup.git_operations.GitBackup", make_git_backup(tracker))
+
+    state_manager = SyncStateManager(backup_settings.data_dir, s3_storage)
+    recording_threads: list[str] = []
+    update_in_memory = state_manager.update_repo_state_in_memory
+
+    def record_update(*args, **kwargs):
+        recording_threads.append(threading.current_thread().name)
+        update_in_memory(*args, **kwargs)
+
+    monkeypatch.setattr(state_manager, "update_repo_state_in_memory", record_update)
+
+    return SimpleNamespace(
+        settings=backup_settings,
+        s3_storage=s3_storage,
+        state_manager=state_manager,
+        tracker=tracker,
+        summaries=summaries,
+        recording_threads=recording_threads,
+    )
+
+
+class TestRunBackup:
+    """Tests for run_backup."""
+
+    def test_parallel_backup_records_only_uploaded_repos(self, fake_run: SimpleNamespace):
+        """Test statistics, state and the in-flight bound of a parallel run."""
+        success = main.run_backup(fake_run.settings, fake_run.s3_storage, fake_run.state_manager)
+
+        assert success is False  # two repositories failed
+        stats = fake_run.summaries[0]
+        assert stats["repos"] == 10
+        assert stats["errors"] == 2
+        assert stats["total_size"] == 110  # upload-fails was bundled, but not uploaded
+        assert stats["shutdown_skipped"] == 0
+
+        # Only repositories whose uploads succeeded are recorded, from the main thread
+        saved = SyncStateManager(fake_run.settings.data_dir).get_all_states()
+        assert saved == {f"repo{i}": f"repo{i}-pushed" for i in range(10)}
+        assert set(fake_run.recording_threads) == {threading.main_thread().name}
+        assert sorted(fake_run.s3_storage.uploaded) == sorted(saved)
+
+        # At most twice as many repositories as workers are cloned or uploading
+        assert fake_run.tracker.maximum <= 2 * fake_run.settings.backup_parallelism
+        assert fake_run.s3_storage.cleanup_calls == 1
+
+    def test_shutdown_skips_remaining_repos(
+        self, monkeypatch: pytest.MonkeyPatch, fake_run: SimpleNamespace
+    ):
+        """Test that a shutdown finishes started repositories and skips the rest."""
+        def request_shutdown(repo_name: str) -> None:
+            main.shutdown_handler._shutdown_requested.set()
+
+        monkeypatch.setattr(
+            "backup.git_operations.GitBackup", make_git_backup(fake_run.tracker, request_shutdown)
+        )
+
+        main.run_backup(fake_run.settings, fake_run.s3_storage, fake_run.state_manager)
+
+        stats = fake_run.summaries[0]
+        started = stats["repos"] + stats["errors"]
+        assert 1 <= started <= fake_run.settings.backup_parallelism
+        assert stats["shutdown_skipped"] == len(REPO_NAMES) - started
+        assert len(SyncStateManager(fake_run.settings.data_dir).get_all_states()) == stats["repos"]
+        # Retention cleanup is skipped when shutting down
+        assert fake_run.s3_storage.cleanup_calls == 0
+
+    def test_cleanup_runs_every_interval(self, fake_run: SimpleNamespace):
+        """Test that retention cleanup only runs every BACKUP_CLEANUP_INTERVAL runs."""
+        fake_run.settings.backup_cleanup_interval = 2
+        fake_run.settings.backup_incremental = False
+
+        cleanup_calls = []
+        for _ in range(4):
+            main.run_backup(fake_run.settings, fake_run.s3_storage, fake_run.state_manager)
+            cleanup_calls.append(fake_run.s3_storage.cleanup_calls)
+
+        assert cleanup_calls == [0, 1, 1, 2]
@@ -4,8 +4,10 @@ GitHub Backup - S3 Client Tests
 Tests for S3 storage operations using moto for S3 emulation.
 """
 
+import io
 import json
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from moto import mock_aws
@@ -44,6 +46,20 @@ class TestS3Storage:
         result = storage.ensure_bucket_exists()
         assert result is True
 
+    @mock_aws
+    def test_ensure_bucket_exists_is_cached(self, test_settings: Settings):
+        """Test that the bucket is only checked once per process."""
+        test_settings.s3_bucket = "cached-test-bucket"
+
+        storage = S3Storage(test_settings)
+        assert storage.ensure_bucket_exists() is True
+
+        # A new instance for the same bucket must not query S3 again
+        storage = S3Storage(test_settings)
+        with patch.object(storage.s3, "head_bucket") as head_bucket:
+            assert storage.ensure_bucket_exists() is True
+        head_bucket.assert_not_called()
+
     @mock_aws
     def test_upload_file(self, test_settings: Settings, temp_dir: Path):
         """Test file upload to S3."""
@@ -64,6 +80,29 @@ class TestS3Storage:
         response = storage.s3.get_object(Bucket=test_settings.s3_bucket, Key=key)
         assert response["Body"].read() == b"test content for bundle"
 
+    @mock_aws
+    def test_upload_stream_non_seekable(self, test_settings: Settings):
+        """Test that a non-seekable stream is uploaded with its exact content."""
+        storage = S3Storage(test_settings)
+        storage.s3.create_bucket(Bucket=test_settings.s3_bucket)
+
+        content = bytes(range(256)) * 4096
+
+        class PipeReader:
+            """Readable stream without seek/tell, like a process pipe."""
+
+            def __init__(self, data: bytes):
+                self.buffer = io.BytesIO(data)
+
+            def read(self, size: int = -1) -> bytes:
+                return self.buffer.read(size)
+
+        key = storage.upload_stream(PipeReader(content), "repo.bundle", "2024-01-15_02-00-00", "repo")
+
+        assert key == "test-org/repo/2024-01-15_02-00-00/repo.bundle"
+        response = storage.s3.get_object(Bucket=test_settings.s3_bucket, Key=key)
+        assert response["Body"].read() == content
+
     @mock_aws
     def test_upload_directory(self, test_settings: Settings, temp_dir: Path):
         """Test directory upload to S3."""
@@ -110,6 +149,37 @@ class TestS3Storage:
         # Should be sorted newest first
         assert result == ["2024-01-03_02-00-00", "2024-01-02_02-00-00", "2024-01-01_02-00-00"]
 
+    @mock_aws
+    def test_list_backup_objects(self, test_settings: Settings, temp_dir: Path):
+        """Test that a backup listing finds the uploaded objects of one backup only."""
+        storage = S3Storage(test_settings)
+        storage.s3.create_bucket(Bucket=test_settings.s3_bucket)
+
+        bundle = temp_dir / "repo.bundle"
+        bundle.write_bytes(b"content")
+
+        backup_id = "2024-01-15_02-00-00"
+        repos = ["alpha", "Beta", "0-config", ".github", "_private", "repo", "repo-x"]
+        for repo in repos:
+            storage.upload_file(bundle, backup_id, repo)
+        # Objects of another backup and the state file must not be listed
+        storage.upload_file(bundle, "2024-01-14_02-00-00", "alpha")
+        storage.upload_file(bundle, "2024-01-14_02-00-00", "old-repo")
+        state = temp_dir / "state.json"
+        state.write_text("{}")
+        storage.upload_state(state)
+
+        with patch.object(storage, "_list_prefix", wraps=storage._list_prefix) as list_prefix:
+            objects = storage.list_backup_objects(backup_id)
+
+        expected = sorted(f"test-org/{repo}/{backup_id}/repo.bundle" for repo in repos)
+        assert [obj["Key"] for obj in objects] == expected
+        # Only the backup folder of each repository is listed
+        assert all(call.args[0].endswith(f"/{backup_id}/") for call in list_prefix.call_args_list)
+        assert [obj["Key"] for obj in storage.list_backup_objects(backup_id, "Beta")] == [
+            f"test-org/Beta/{backup_id}/repo.bundle"
+        ]
+
     @mock_aws
     def test_delete_backup(self, test_settings: Settings):
         """Test deleting a backup."""
@@ -143,6 +213,33 @@ class TestS3Storage:
             )
             assert response.get("KeyCount", 0) == 0
 
+    @mock_aws
+    def test_delete_backup_more_than_one_batch(self, test_settings: Settings):
+        """Test that backups with more than 1000 objects are deleted completely."""
+        storage = S3Storage(test_settings)
+        storage.s3.create_bucket(Bucket=test_settings.s3_bucket)
+
+        backup_id = "2024-01-15_02-00-00"
+        for repo in ["repo1", "repo2"]:
+            for i in range(600):
+                storage.s3.put_object(
+                    Bucket=test_settings.s3_bucket,
+                    Key=f"test-org/{repo}/{backup_id}/metadata/{i}.json",
+                    Body=b"{}",
+                )
+        storage.s3.put_object(
+            Bucket=test_settings.s3_bucket,
+            Key="test-org/repo1/2024-01-14_02-00-00/repo1.bundle",
+            Body=b"content",
+        )
+
+        with patch.object(storage.s3, "delete_objects", wraps=storage.s3.delete_objects) as delete_objects:
+            deleted = storage.delete_backup(backup_id)
+
+        assert deleted == 1200
+        assert delete_objects.call_count == 2
+        assert storage.list_backups() == ["2024-01-14_02-00-00"]
+
     @mock_aws
     def test_cleanup_old_backups_respects_retention(self, test_settings: Settings):
         """Test that cleanup keeps the configured number of backups."""
@@ -232,6 +329,61 @@ class TestS3Storage:
         assert size == 1500
 
 
+    @mock_aws
+    def test_get_backup_summaries(self, test_settings: Settings):
+        """Test collecting size and repo count per backup from a single listing."""
+        storage = S3Storage(test_settings)
+        storage.s3.create_bucket(Bucket=test_settings.s3_bucket)
+
+        objects = {
+            "test-org/repo1/2024-01-01_02-00-00/repo1.bundle": b"x" * 100,
+            "test-org/repo1/2024-01-02_02-00-00/repo1.bundle": b"x" * 200,
+            "test-org/repo1/2024-01-02_02-00-00/metadata/issues.json": b"x" * 10,
+            "test-org/repo2/2024-01-02_02-00-00/repo2.bundle": b"x" * 300,
+            "test-org/state.json": b"{}",
+        }
+        for key, body in objects.items():
+            storage.s3.put_object(Bucket=test_settings.s3_bucket, Key=key, Body=body)
+
+        summaries = storage.get_backup_summaries()
+
+        assert summaries == {
+            "2024-01-01_02-00-00": (100, 1),
+            "2024-01-02_02-00-00": (510, 2),
+        }
+
+    @mock_aws
+    def test_copy_file_missing_source(self, test_settings: Settings):
+        """Test that copying a file that does not exist returns None."""
+        storage = S3Storage(test_settings)
+        storage.s3.create_bucket(Bucket=test_settings.s3_bucket)
+
+        size = storage.copy_file("repo.bundle", "2024-01-14_02-00-00", "2024-01-15_02-00-00", "repo")
+
+        assert size is None
+        response = storage.s3.list_objects_v2(Bucket=test_settings.s3_bucket)
+        assert response.get("KeyCount", 0) == 0
+
+    @mock_aws
+    def test_copy_file_from_previous_backup(self, test_settings: Settings, temp_dir: Path):
+        """Test that a file is copied from an earlier backup with the storage class."""
+        test_settings.s3_storage_class = "STANDARD_IA"
+        storage = S3Storage(test_settings)
+        storage.s3.create_bucket(Bucket=test_settings.s3_bucket)
+
+        bundle = temp_dir / "repo.bundle"
+        bundle.write_bytes(b"bundle content")
+        storage.upload_file(bundle, "2024-01-14_02-00-00", "repo")
+
+        size = storage.copy_file("repo.bundle", "2024-01-14_02-00-00", "2024-01-15_02-00-00", "repo")
+
+        assert size == len(b"bundle content")
+        key = "test-org/repo/2024-01-15_02-00-00/repo.bundle"
+        response = storage.s3.get_object(Bucket=test_settings.s3_bucket, Key=key)
+        assert response["Body"].read() == b"bundle content"
+        assert response["StorageClass"] == "STANDARD_IA"
+
+
 class TestMultipartUploader:
     """Tests for MultipartUploader class."""
 
@@ -253,12 +405,42 @@ class TestMultipartUploader:
             threshold=100 * 1024 * 1024,  # 100MB threshold
         )
 
-        uploader.upload_file(small_file, "test-key")
+        with patch.object(storage.s3, "put_object", wraps=storage.s3.put_object) as put_object:
+            uploader.upload_file(small_file, "test-key")
+
+        put_object.assert_called_once()
 
         # Verify upload
         response = storage.s3.get_object(Bucket=test_settings.s3_bucket, Key="test-key")
         assert response["Body"].read() == b"small content"
 
+    @mock_aws
+    def test_file_below_two_chunks_uses_single_put(self, test_settings: Settings, temp_dir: Path):
+        """Test that files above the threshold but below two chunks use a single PUT."""
+        storage = S3Storage(test_settings)
+        storage.s3.create_bucket(Bucket=test_settings.s3_bucket)
+
+        test_file = temp_dir / "medium.bundle"
+        test_file.write_bytes(b"x" * 2048)
+
+        uploader = MultipartUploader(
+            s3_client=storage.s3,
+            bucket=test_settings.s3_bucket,
+            chunk_size=5 * 1024 * 1024,
+            threshold=1024,
+        )
+
+        with (
+            patch.object(storage.s3, "put_object", wraps=storage.s3.put_object) as put_object,
+            patch.object(storage.s3, "create_multipart_upload") as create_multipart_upload,
+        ):
+            uploader.upload_file(test_file, "test-key")
+
+        put_object.assert_called_once()
+        create_multipart_upload.assert_not_called()
+        response = storage.s3.get_object(Bucket=test_settings.s3_bucket, Key="test-key")
+        assert response["Body"].read() == b"x" * 2048
+
     @pytest.mark.skip(reason="S3/Moto requires minimum 5MB per part for multipart upload")
     @mock_aws
     def test_large_file_uses_multipart_upload(self, test_settings: Settings, temp_dir: Path):
@@ -0,0 +1,45 @@
+"""
+GitHub Backup - Scheduler Tests
+
+Tests for reusing the S3 client and sync state across scheduled runs.
+"""
+
+from unittest.mock import patch
+
+from moto import mock_aws
+
+from config import Settings
+from scheduler import BackupScheduler
+
+
+class TestBackupScheduler:
+    """Tests for BackupScheduler class."""
+
+    @mock_aws
+    def test_clients_are_recreated_once_per_settings_change(self, test_settings: Settings):
+        """Test that runs after a settings change reuse the recreated clients."""
+        runs = []
+
+        def backup() -> bool:
+            runs.append((scheduler.settings, scheduler.s3_storage, scheduler.state_manager))
+            return True
+
+        scheduler = BackupScheduler(test_settings, backup)
+        scheduler.s3_storage.s3.create_bucket(Bucket=test_settings.s3_bucket)
+        s3_storage, state_manager = scheduler.s3_storage, scheduler.state_manager
+
+        with patch("scheduler.get_fresh_settings", return_value=test_settings):
+            scheduler._run_backup_with_state()
+        assert runs[-1] == (test_settings, s3_storage, state_manager)
+
+        new_settings = test_settings.model_copy(update={"backup_parallelism": 8})
+        with patch("scheduler.get_fresh_settings", return_value=new_settings):
+            scheduler._run_backup_with_state()
+            scheduler._run_backup_with_state()
+
+        assert runs[1][0] is new_settings
+        assert runs[1][1] is not s3_storage
+        assert runs[1][2] is not state_manager
+        # The second run with the new settings reuses the recreated clients
+        assert runs[2] == runs[1]
+        assert scheduler.state_manager.get_last_sync_time() is not None
@@ -0,0 +1,136 @@
+"""
+GitHub Backup - Sync State Manager Tests
+
+Tests for when the sync state is written to disk and uploaded to S3.
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sync_state_manager import SyncStateManager
+
+
+@pytest.fixture
+def s3_storage() -> MagicMock:
+    """Create a mocked S3Storage that reports existing remote state."""
+    s3_storage = MagicMock()
+    s3_storage.state_exists.return_value = True
+    s3_storage.download_state.return_value = False
+    s3_storage.upload_state.return_value = True
+    return s3_storage
+
+
+@pytest.fixture
+def state_manager(temp_dir: Path, s3_storage: MagicMock) -> SyncStateManager:
+    """Create a state manager with a mocked S3Storage."""
+    return SyncStateManager(str(temp_dir), s3_storage)
+
+
+class TestSyncStateManager:
+    """Tests for SyncStateManager saving behaviour."""
+
+    def test_in_memory_updates_are_saved_on_flush(
+        self, state_manager: SyncStateManager, s3_storage: MagicMock
+    ):
+        """Test that in-memory updates are only written by flush()."""
+        state_manager.update_repo_state_in_memory("repo1", "t1", "backup-1")
+        state_manager.update_repo_state_in_memory("repo2", "t2", "backup-1")
+
+        assert not state_manager.state_file.exists()
+        s3_storage.upload_state.assert_not_called()
+
+        state_manager.flush()
+
+        assert s3_storage.upload_state.call_count == 1
+        reloaded = SyncStateManager(str(state_manager.state_file.parent))
+        assert reloaded.get_all_states() == {"repo1": "t1", "repo2": "t2"}
+
+    def test_flush_without_changes_does_not_write(
+        self, state_manager: SyncStateManager, s3_storage: MagicMock
+    ):
+        """Test that flush() does nothing if there are no pending updates."""
+        state_manager.flush()
+        assert not state_manager.state_file.exists()
+
+        state_manager.update_repo_state("repo1", "t1", "backup-1")
+        state_manager.flush()
+
+        assert s3_storage.upload_state.call_count == 1
+
+    def test_batch_update_saves_once(
+        self, state_manager: SyncStateManager, s3_storage: MagicMock
+    ):
+        """Test that all updates inside nested batches cause a single save."""
+        state_manager.update_repo_state("old-repo", "t0", "backup-0")
+        s3_storage.upload_state.reset_mock()
+
+        with state_manager.batch_update():
+            state_manager.update_repo_state("repo1", "t1", "backup-1")
+            with state_manager.batch_update():
+                state_manager.update_repo_state("repo2", "t2", "backup-1")
+                state_manager.remove_repo_state("old-repo")
+            # The inner batch must not save while the outer one is open
+            s3_storage.upload_state.assert_not_called()
+            state_manager.update_sync_time()
+            s3_storage.upload_state.assert_not_called()
+
+        assert s3_storage.upload_state.call_count == 1
+        reloaded = SyncStateManager(str(state_manager.state_file.parent))
+        assert reloaded.get_all_states() == {"repo1": "t1", "repo2": "t2"}
+        assert reloaded.get_last_sync_time() is not None
+
+    def test_batch_update_saves_when_block_raises(
+        self, state_manager: SyncStateManager, s3_storage: MagicMock
+    ):
+        """Test that pending updates are saved if the batch block raises."""
+        with pytest.raises(RuntimeError):
+            with state_manager.batch_update():
+                state_manager.update_repo_state("repo1", "t1", "backup-1")
+                raise RuntimeError("backup failed")
+
+        assert s3_storage.upload_state.call_count == 1
+        reloaded = SyncStateManager(str(state_manager.state_file.parent))
+        assert reloaded.get_all_states() == {"repo1": "t1"}
+
+    def test_save_leaves_no_temporary_file(self, state_manager: SyncStateManager):
+        """Test that the state file is replaced without leaving a temporary file."""
+        state_manager.update_repo_state("repo1", "t1", "backup-1")
+        state_manager.update_repo_state("repo2", "t2", "backup-1")
+
+        assert [path.name for path in state_manager.state_file.parent.iterdir()] == ["state.json"]
+
+    def test_failed_write_keeps_previous_state(
+        self, state_manager: SyncStateManager, s3_storage: MagicMock
+    ):
+        """Test that a failed write leaves the previous state file intact."""
+        state_manager.update_repo_state("repo1", "t1", "backup-1")
+        previous = state_manager.state_file.read_bytes()
+        s3_storage.upload_state.reset_mock()
+
+        with patch("sync_state_manager.os.replace", side_effect=OSError("disk full")):
+            state_manager.update_repo_state("repo2", "t2", "backup-2")
+
+        assert state_manager.state_file.read_bytes() == previous
+        assert not state_manager.state_file.with_name("state.json.tmp").exists()
+        s3_storage.upload_state.assert_not_called()
+
+        # The failed update is still pending and saved by the next flush()
+        state_manager.flush()
+
+        assert s3_storage.upload_state.call_count == 1
+        reloaded = SyncStateManager(str(state_manager.state_file.parent))
+        assert reloaded.get_all_states() == {"repo1": "t1", "repo2": "t2"}
+
+    def test_backups_since_cleanup_counter(self, state_manager: SyncStateManager):
+        """Test that the cleanup counter is persisted and can be reset."""
+        assert state_manager.increment_backups_since_cleanup() == 1
+        assert state_manager.increment_backups_since_cleanup() == 2
+        state_manager.flush()
+
+        reloaded = SyncStateManager(str(state_manager.state_file.parent))
+        assert reloaded.increment_backups_since_cleanup() == 3
+
+        reloaded.reset_backups_since_cleanup()
+        assert reloaded.increment_backups_since_cleanup() == 1
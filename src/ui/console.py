@@ -69,9 +69,13 @@ class BackupLogger:
         """Print a status/progress message."""
         console.print(f"[dim]{message}[/]")
 
-    def debug(self, message: str) -> None:
-        """Log a debug message (with timestamp, only if DEBUG level)."""
-        self._logger.debug(message)
+    def debug(self, message: str, *args: object) -> None:
+        """Log a debug message (with timestamp, only if DEBUG level).
+
+        Optional args are %-formatted into the message only if the message is
+        emitted, which keeps debug logging cheap in per-repository loops.
+        """
+        self._logger.debug(message, *args)
 
     def system(self, message: str) -> None:
         """Log a system message (with timestamp)."""
@@ -144,9 +148,35 @@ def print_repo_status(
     error: Optional[str] = None,
 ) -> None:
     """Print status for a single repository backup."""
+    console.print(format_repo_status(
+        repo_name, git_size, has_lfs, lfs_size, issues, prs, releases, wiki, error
+    ))
+
+
+def print_repo_status_lines(lines: list[str]) -> None:
+    """Print several repository status lines with a single console write.
+
+    Args:
+        lines: Lines created with format_repo_status().
+    """
+    if lines:
+        console.print("\n".join(lines))
+
+
+def format_repo_status(
+    repo_name: str,
+    git_size: Optional[str] = None,
+    has_lfs: bool = False,
+    lfs_size: Optional[str] = None,
+    issues: Optional[int] = None,
+    prs: Optional[int] = None,
+    releases: Optional[int] = None,
+    wiki: Optional[bool] = None,
+    error: Optional[str] = None,
+) -> str:
+    """Format the status line for a single repository backup."""
     if error:
-        console.print(f"  [red]✗[/] {repo_name}: [red]{error}[/]")
-        return
+        return f"  [red]✗[/] {repo_name}: [red]{error}[/]"
 
     parts = [f"[green]✓[/] {repo_name}"]
 
@@ -172,7 +202,7 @@ def print_repo_status(
     elif wiki is False:
         parts.append("[dim]Wiki: -[/]")
 
-    console.print("  " + " | ".join(parts))
+    return "  " + " | ".join(parts)
 
 
 def print_summary(stats: dict, duration_seconds: float) -> None:
@@ -217,7 +247,7 @@ def print_summary(stats: dict, duration_seconds: float) -> None:
             f"[yellow]{stats['shutdown_skipped']}[/] [dim](not started)[/]"
         )
 
-    if "deleted_backups" in stats:
+    if stats.get("deleted_backups", 0) > 0:
         table.add_row("Old Backups Removed", str(stats["deleted_backups"]))
 
     console.print()